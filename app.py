@@ -8,17 +8,31 @@ import json
 import logging
 import logging.handlers
 import os
+import queue
 import threading
 
 import psutil
 import pystray
 from PIL import Image
 
+# Prefer orjson when available (2-5x faster, dumps straight to bytes);
+# the stdlib encoder is a drop-in fallback.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
 from core.split_engine import SplitEngine
-from core.network_utils import (
-    get_default_interface, get_vpn_interface, get_interface_index,
-    get_gateway_for_interface,
-)
+from core.iphlpapi import get_if_counters
+from core.network_utils import enumerate_interfaces
 from ui.main_window import MainWindow
 from ui.logo import render_app_icon
 
@@ -29,6 +43,11 @@ ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "freakuency.log")
 
+# Parsed-config cache keyed by file mtime: skips the JSON re-parse when
+# the file is unchanged, and lets the saver skip writes that would
+# produce an identical payload.
+_cfg_cache = {"mtime_ns": None, "data": None}
+
 
 class SplitTunnelApp:
     """Main application controller."""
@@ -51,8 +70,20 @@ class SplitTunnelApp:
         logging.getLogger().addHandler(file_handler)
 
         self._engine = SplitEngine()
-        self._stats_job = None
+        self._stats_stop = None
+        self._cfg_save_job = None
+
+        # Single persistent worker for Start/Stop — avoids spawning a
+        # thread per click and serializes back-to-back Start/Stop so
+        # they can never interleave.  The generation counter lets a
+        # newer click supersede work still sitting in the queue.
+        self._work_q = queue.Queue()
+        self._work_gen = 0
+        threading.Thread(
+            target=self._worker_loop, daemon=True, name="AppWorker"
+        ).start()
         self._vpn_iface_name = None
+        self._vpn_if_index = None
         self._baseline_bytes_in = 0
         self._baseline_bytes_out = 0
 
@@ -92,6 +123,26 @@ class SplitTunnelApp:
         """Start the application main loop."""
         self._window.mainloop()
 
+    # ------------------------------------------------------------------
+    # Background worker
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self):
+        """Run queued Start/Stop jobs one at a time."""
+        while True:
+            gen, fn = self._work_q.get()
+            if gen != self._work_gen:
+                continue  # superseded by a newer click
+            try:
+                fn()
+            except Exception as e:
+                log.error(f"Background task failed: {e}")
+
+    def _submit_work(self, fn):
+        """Queue a job on the worker, superseding any pending ones."""
+        self._work_gen += 1
+        self._work_q.put((self._work_gen, fn))
+
     # ------------------------------------------------------------------
     # Config persistence
     # ------------------------------------------------------------------
@@ -102,8 +153,14 @@ class SplitTunnelApp:
             return
 
         try:
-            with open(CONFIG_PATH, "r") as f:
-                cfg = json.load(f)
+            mtime_ns = os.stat(CONFIG_PATH).st_mtime_ns
+            if mtime_ns == _cfg_cache["mtime_ns"]:
+                cfg = _cfg_cache["data"]
+            else:
+                with open(CONFIG_PATH, "rb") as f:
+                    cfg = _json_loads(f.read())
+                _cfg_cache["mtime_ns"] = mtime_ns
+                _cfg_cache["data"] = cfg
 
             mode = cfg.get("mode", "vpn_default")
             self._window.config_frame.set_mode(mode)
@@ -116,27 +173,52 @@ class SplitTunnelApp:
         except Exception as e:
             log.warning(f"Failed to load config: {e}")
 
+    def _snapshot_config(self):
+        """Collect the current settings into a plain dict (UI thread)."""
+        return {
+            "mode": self._window.config_frame.mode,
+            "toggled_apps": list(self._window.app_list.get_toggled_apps()),
+        }
+
     def _save_config(self):
-        """Persist current settings to config.json."""
+        """Schedule a debounced config write.
+
+        Mode changes and per-app toggles can arrive in rapid bursts;
+        coalescing them into one write per 500 ms quiet period keeps
+        JSON encoding and disk I/O off the UI callback path.
+        """
+        if self._cfg_save_job:
+            self._window.after_cancel(self._cfg_save_job)
+        self._cfg_save_job = self._window.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Snapshot settings and hand the write to a background thread."""
+        self._cfg_save_job = None
+        cfg = self._snapshot_config()
+        threading.Thread(
+            target=self._write_config, args=(cfg,), daemon=True
+        ).start()
+
+    def _write_config(self, cfg):
+        """Write the config atomically (tempfile + rename)."""
+        if cfg == _cfg_cache["data"]:
+            return  # on-disk file already matches
         try:
-            cfg = {
-                "mode": self._window.config_frame.mode,
-                "toggled_apps": list(self._window.app_list.get_toggled_apps()),
-            }
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(cfg, f, indent=2)
+            tmp_path = CONFIG_PATH + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(cfg))
+            os.replace(tmp_path, CONFIG_PATH)
+            _cfg_cache["mtime_ns"] = os.stat(CONFIG_PATH).st_mtime_ns
+            _cfg_cache["data"] = cfg
         except Exception as e:
             log.warning(f"Failed to save config: {e}")
 
     def _export_config(self, path):
         """Export current config to a user-chosen file."""
         try:
-            cfg = {
-                "mode": self._window.config_frame.mode,
-                "toggled_apps": list(self._window.app_list.get_toggled_apps()),
-            }
-            with open(path, "w") as f:
-                json.dump(cfg, f, indent=2)
+            cfg = self._snapshot_config()
+            with open(path, "wb") as f:
+                f.write(_json_dumps(cfg))
             log.info(f"Config exported to {path}")
         except Exception as e:
             log.warning(f"Failed to export config: {e}")
@@ -144,8 +226,8 @@ class SplitTunnelApp:
     def _import_config(self, path):
         """Import config from a user-chosen file."""
         try:
-            with open(path, "r") as f:
-                cfg = json.load(f)
+            with open(path, "rb") as f:
+                cfg = _json_loads(f.read())
 
             mode = cfg.get("mode", "vpn_default")
             self._window.config_frame.set_mode(mode)
@@ -195,10 +277,13 @@ class SplitTunnelApp:
     def _on_start(self):
         """User clicked Start — detect VPN and start split engine."""
         def _do_start():
-            vpn_name, vpn_ip = get_vpn_interface()
-            default_name, default_ip = get_default_interface()
+            # One enumeration pass gathers both interfaces, their
+            # indexes, and the default gateway
+            snapshot = enumerate_interfaces()
+            vpn = snapshot.vpn
+            default = snapshot.default
 
-            if not vpn_ip:
+            if not vpn.ip:
                 self._window.after(0, self._show_error,
                     "No VPN detected.\n\n"
                     "Connect to a VPN using your VPN client first, "
@@ -207,27 +292,22 @@ class SplitTunnelApp:
                     "NO_VPN", "")
                 return
 
-            if not default_ip:
+            if not default.ip:
                 self._window.after(0, self._show_error,
                     "Could not detect default network interface.")
                 return
 
-            self._vpn_iface_name = vpn_name
-
-            # Get interface indexes for packet redirection
-            vpn_if_index = get_interface_index(vpn_name)
-            default_if_index = get_interface_index(default_name)
+            self._vpn_iface_name = vpn.name
+            self._vpn_if_index = vpn.if_index
 
-            if vpn_if_index is None or default_if_index is None:
+            if vpn.if_index is None or default.if_index is None:
                 log.warning(
                     f"Could not resolve interface indexes: "
-                    f"vpn={vpn_if_index}, default={default_if_index}. "
+                    f"vpn={vpn.if_index}, default={default.if_index}. "
                     f"Packet redirection may not work."
                 )
 
-            # Get the real default gateway (for the non-VPN interface)
-            default_gateway = get_gateway_for_interface(default_ip)
-            if not default_gateway:
+            if not default.gateway:
                 log.warning(
                     "Could not detect default gateway for the non-VPN interface. "
                     "Split tunnel routing may not work."
@@ -241,14 +321,14 @@ class SplitTunnelApp:
 
             try:
                 self._engine.start(
-                    mode, vpn_ip, default_ip, toggled,
-                    vpn_if_index=vpn_if_index,
-                    default_if_index=default_if_index,
-                    default_gateway=default_gateway,
+                    mode, vpn.ip, default.ip, toggled,
+                    vpn_if_index=vpn.if_index,
+                    default_if_index=default.if_index,
+                    default_gateway=default.gateway,
                 )
-                log.info(f"Split engine started: vpn={vpn_name} ({vpn_ip}, idx={vpn_if_index}), "
-                         f"default={default_name} ({default_ip}, idx={default_if_index}), "
-                         f"gateway={default_gateway}")
+                log.info(f"Split engine started: vpn={vpn.name} ({vpn.ip}, idx={vpn.if_index}), "
+                         f"default={default.name} ({default.ip}, idx={default.if_index}), "
+                         f"gateway={default.gateway}")
             except Exception as e:
                 log.error(f"Failed to start split engine: {e}")
                 self._window.after(0, self._show_error,
@@ -257,15 +337,15 @@ class SplitTunnelApp:
 
             # Update UI on main thread
             def _update_ui():
-                self._window.config_frame.set_vpn_info(vpn_name, vpn_ip)
+                self._window.config_frame.set_vpn_info(vpn.name, vpn.ip)
                 self._window.config_frame.update_state("ACTIVE", "")
-                self._window.status_bar.set_vpn_adapter(vpn_name, vpn_ip)
+                self._window.status_bar.set_vpn_adapter(vpn.name, vpn.ip)
                 self._window.status_bar.set_connected()
                 self._start_stats_polling()
 
             self._window.after(0, _update_ui)
 
-        threading.Thread(target=_do_start, daemon=True).start()
+        self._submit_work(_do_start)
 
     def _on_stop(self):
         """User clicked Stop — stop split engine (VPN stays connected)."""
@@ -273,7 +353,7 @@ class SplitTunnelApp:
             self._stop_split_engine()
             self._window.after(0, self._on_stopped)
 
-        threading.Thread(target=_do_stop, daemon=True).start()
+        self._submit_work(_do_stop)
 
     def _on_stopped(self):
         """Update UI after engine stops."""
@@ -312,45 +392,78 @@ class SplitTunnelApp:
         self._save_config()
 
     # ------------------------------------------------------------------
-    # Stats polling (NIC counters via psutil)
+    # Stats polling (VPN NIC counters, background thread)
     # ------------------------------------------------------------------
 
-    def _capture_baseline(self):
-        """Record current NIC counters so stats show delta from start."""
+    def _read_vpn_counters(self):
+        """Return (bytes_in, bytes_out) for the VPN NIC, or None.
+
+        Reads the single adapter via GetIfEntry2 (O(1) in adapter count);
+        falls back to the psutil pernic snapshot if the native call fails.
+        """
+        if self._vpn_if_index is not None:
+            counters = get_if_counters(self._vpn_if_index)
+            if counters is not None:
+                return counters
         try:
             counters = psutil.net_io_counters(pernic=True)
             if self._vpn_iface_name and self._vpn_iface_name in counters:
                 nic = counters[self._vpn_iface_name]
-                self._baseline_bytes_in = nic.bytes_recv
-                self._baseline_bytes_out = nic.bytes_sent
-            else:
-                self._baseline_bytes_in = 0
-                self._baseline_bytes_out = 0
+                return nic.bytes_recv, nic.bytes_sent
         except Exception:
+            pass
+        return None
+
+    def _capture_baseline(self):
+        """Record current NIC counters so stats show delta from start."""
+        counters = self._read_vpn_counters()
+        if counters is not None:
+            self._baseline_bytes_in, self._baseline_bytes_out = counters
+        else:
             self._baseline_bytes_in = 0
             self._baseline_bytes_out = 0
 
+    # Poll interval and the minimum counter movement that triggers a
+    # UI update — idle sessions cause no UI-thread wakeups at all.
+    _STATS_INTERVAL = 2.0
+    _STATS_MIN_DELTA = 1024
+
     def _start_stats_polling(self):
-        self._poll_stats()
+        self._stop_stats_polling()
+        self._stats_stop = threading.Event()
+        threading.Thread(
+            target=self._stats_loop, args=(self._stats_stop,),
+            daemon=True, name="StatsPoll",
+        ).start()
 
     def _stop_stats_polling(self):
-        if self._stats_job:
-            self._window.after_cancel(self._stats_job)
-            self._stats_job = None
-
-    def _poll_stats(self):
-        """Fetch VPN NIC traffic stats and schedule next poll."""
-        if self._engine.running and self._vpn_iface_name:
-            try:
-                counters = psutil.net_io_counters(pernic=True)
-                if self._vpn_iface_name in counters:
-                    nic = counters[self._vpn_iface_name]
-                    bytes_in = nic.bytes_recv - self._baseline_bytes_in
-                    bytes_out = nic.bytes_sent - self._baseline_bytes_out
-                    self._window.status_bar.update_stats(bytes_in, bytes_out)
-            except Exception:
-                pass
-        self._stats_job = self._window.after(2000, self._poll_stats)
+        if self._stats_stop:
+            self._stats_stop.set()
+            self._stats_stop = None
+
+    def _stats_loop(self, stop):
+        """Background thread: read VPN NIC counters, notify UI on change.
+
+        Runs off the Tk scheduler entirely; the UI thread is only woken
+        when the counters moved by at least _STATS_MIN_DELTA bytes.
+        """
+        last_in = last_out = None
+        while not stop.wait(self._STATS_INTERVAL):
+            if not (self._engine.running and self._vpn_iface_name):
+                continue
+            counters = self._read_vpn_counters()
+            if counters is None:
+                continue
+            bytes_in = counters[0] - self._baseline_bytes_in
+            bytes_out = counters[1] - self._baseline_bytes_out
+            if (last_in is not None
+                    and bytes_in - last_in < self._STATS_MIN_DELTA
+                    and bytes_out - last_out < self._STATS_MIN_DELTA):
+                continue
+            last_in, last_out = bytes_in, bytes_out
+            self._window.after(
+                0, self._window.status_bar.update_stats, bytes_in, bytes_out
+            )
 
     # ------------------------------------------------------------------
     # System tray
@@ -401,7 +514,12 @@ class SplitTunnelApp:
 
     def _full_exit(self):
         """Clean up everything and destroy the app."""
-        self._save_config()
+        # Flush any pending debounced save synchronously — the window
+        # (and its after() queue) is about to go away.
+        if self._cfg_save_job:
+            self._window.after_cancel(self._cfg_save_job)
+            self._cfg_save_job = None
+        self._write_config(self._snapshot_config())
         self._stop_stats_polling()
         try:
             self._stop_split_engine()
@@ -420,11 +538,32 @@ class SplitTunnelApp:
     # ------------------------------------------------------------------
 
     def _load_default_icon(self):
-        """Load the default fallback icon from assets."""
+        """Load the default fallback icon from assets.
+
+        A pre-resized 32x32 copy is cached next to the source PNG so
+        subsequent startups skip the decode+resample on the UI thread;
+        the cache is refreshed whenever the source is newer.
+        """
         path = os.path.join(ASSETS_DIR, "default_icon.png")
+        cached = os.path.join(ASSETS_DIR, "default_icon_32.png")
+
+        try:
+            if os.path.isfile(cached) and (
+                not os.path.isfile(path)
+                or os.path.getmtime(cached) >= os.path.getmtime(path)
+            ):
+                return Image.open(cached)
+        except Exception:
+            pass
+
         if os.path.isfile(path):
             try:
-                return Image.open(path).resize((32, 32))
+                icon = Image.open(path).resize((32, 32))
+                try:
+                    icon.save(cached)
+                except Exception:
+                    pass
+                return icon
             except Exception:
                 pass
         return None
@@ -0,0 +1,393 @@
+"""
+Windows IP Helper API bindings (ctypes) for interface enumeration
+and statistics.
+
+network_utils originally shelled out to PowerShell (Get-NetAdapter) and
+route.exe, and the stats poll in app.py went through psutil's pernic
+snapshot.  These bindings replace those with single IP Helper calls:
+
+- GetAdaptersAddresses: one syscall returning name / description /
+  ifIndex / status / IPv4 for every adapter (no PowerShell cold start).
+- GetIfEntry2: fills a single MIB_IF_ROW2 for a known ifIndex, so each
+  stats poll touches exactly one adapter.
+- GetIpForwardTable2: returns the routing table as a struct array in
+  microseconds (no route.exe fork + text-table parse).
+- NotifyIpInterfaceChange: kernel callback on interface/IP events, so
+  VPN detection can wait on an event instead of polling every 500 ms.
+"""
+
+import ctypes
+import ctypes.wintypes as wt
+from collections import namedtuple
+from ctypes import (
+    POINTER, Structure, byref, c_ubyte, c_ulonglong, c_void_p, cast, windll,
+)
+
+AF_INET = 2
+NO_ERROR = 0
+ERROR_BUFFER_OVERFLOW = 111
+
+# GetAdaptersAddresses flags — skip the lists we never walk
+_GAA_FLAG_SKIP_ANYCAST = 0x0002
+_GAA_FLAG_SKIP_MULTICAST = 0x0004
+_GAA_FLAG_SKIP_DNS_SERVER = 0x0008
+
+_IF_OPER_STATUS_UP = 1
+_MAX_ADAPTER_ADDRESS_LENGTH = 8
+
+_IF_MAX_STRING_SIZE = 256
+_IF_MAX_PHYS_ADDRESS_LENGTH = 32
+
+
+class _GUID(Structure):
+    _fields_ = [
+        ("Data1", wt.DWORD),
+        ("Data2", wt.WORD),
+        ("Data3", wt.WORD),
+        ("Data4", c_ubyte * 8),
+    ]
+
+
+class MIB_IF_ROW2(Structure):
+    """Mirror of the Win32 MIB_IF_ROW2 structure (iphlpapi/netioapi.h)."""
+    _fields_ = [
+        ("InterfaceLuid",              c_ulonglong),
+        ("InterfaceIndex",             wt.DWORD),
+        ("InterfaceGuid",              _GUID),
+        ("Alias",                      wt.WCHAR * (_IF_MAX_STRING_SIZE + 1)),
+        ("Description",                wt.WCHAR * (_IF_MAX_STRING_SIZE + 1)),
+        ("PhysicalAddressLength",      wt.ULONG),
+        ("PhysicalAddress",            c_ubyte * _IF_MAX_PHYS_ADDRESS_LENGTH),
+        ("PermanentPhysicalAddress",   c_ubyte * _IF_MAX_PHYS_ADDRESS_LENGTH),
+        ("Mtu",                        wt.ULONG),
+        ("Type",                       wt.ULONG),
+        ("TunnelType",                 wt.ULONG),
+        ("MediaType",                  wt.ULONG),
+        ("PhysicalMediumType",         wt.ULONG),
+        ("AccessType",                 wt.ULONG),
+        ("DirectionType",              wt.ULONG),
+        ("InterfaceAndOperStatusFlags", c_ubyte),
+        ("OperStatus",                 wt.ULONG),
+        ("AdminStatus",                wt.ULONG),
+        ("MediaConnectState",          wt.ULONG),
+        ("NetworkGuid",                _GUID),
+        ("ConnectionType",             wt.ULONG),
+        ("TransmitLinkSpeed",          c_ulonglong),
+        ("ReceiveLinkSpeed",           c_ulonglong),
+        ("InOctets",                   c_ulonglong),
+        ("InUcastPkts",                c_ulonglong),
+        ("InNUcastPkts",               c_ulonglong),
+        ("InDiscards",                 c_ulonglong),
+        ("InErrors",                   c_ulonglong),
+        ("InUnknownProtos",            c_ulonglong),
+        ("InUcastOctets",              c_ulonglong),
+        ("InMulticastOctets",          c_ulonglong),
+        ("InBroadcastOctets",          c_ulonglong),
+        ("OutOctets",                  c_ulonglong),
+        ("OutUcastPkts",               c_ulonglong),
+        ("OutNUcastPkts",              c_ulonglong),
+        ("OutDiscards",                c_ulonglong),
+        ("OutErrors",                  c_ulonglong),
+        ("OutUcastOctets",             c_ulonglong),
+        ("OutMulticastOctets",         c_ulonglong),
+        ("OutBroadcastOctets",         c_ulonglong),
+        ("OutQLen",                    c_ulonglong),
+    ]
+
+
+class _SOCKADDR_IN(Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_short),
+        ("sin_port",   ctypes.c_ushort),
+        ("sin_addr",   c_ubyte * 4),
+        ("sin_zero",   ctypes.c_char * 8),
+    ]
+
+
+class _SOCKET_ADDRESS(Structure):
+    _fields_ = [
+        ("lpSockaddr",      POINTER(_SOCKADDR_IN)),
+        ("iSockaddrLength", ctypes.c_int),
+    ]
+
+
+class _IP_ADAPTER_UNICAST_ADDRESS(Structure):
+    pass
+
+
+_IP_ADAPTER_UNICAST_ADDRESS._fields_ = [
+    ("Length",  wt.ULONG),
+    ("Flags",   wt.DWORD),
+    ("Next",    POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ("Address", _SOCKET_ADDRESS),
+    # Remaining fields (PrefixOrigin, SuffixOrigin, ...) are never read.
+]
+
+
+class _IP_ADAPTER_ADDRESSES(Structure):
+    pass
+
+
+_IP_ADAPTER_ADDRESSES._fields_ = [
+    ("Length",                wt.ULONG),
+    ("IfIndex",               wt.DWORD),
+    ("Next",                  POINTER(_IP_ADAPTER_ADDRESSES)),
+    ("AdapterName",           ctypes.c_char_p),
+    ("FirstUnicastAddress",   POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ("FirstAnycastAddress",   c_void_p),
+    ("FirstMulticastAddress", c_void_p),
+    ("FirstDnsServerAddress", c_void_p),
+    ("DnsSuffix",             ctypes.c_wchar_p),
+    ("Description",           ctypes.c_wchar_p),
+    ("FriendlyName",          ctypes.c_wchar_p),
+    ("PhysicalAddress",       c_ubyte * _MAX_ADAPTER_ADDRESS_LENGTH),
+    ("PhysicalAddressLength", wt.ULONG),
+    ("Flags",                 wt.ULONG),
+    ("Mtu",                   wt.ULONG),
+    ("IfType",                wt.ULONG),
+    ("OperStatus",            wt.ULONG),
+    # Remaining fields (Ipv6IfIndex, ZoneIndices, ...) are never read.
+]
+
+
+class _SOCKADDR_INET(ctypes.Union):
+    _fields_ = [
+        ("Ipv4",      _SOCKADDR_IN),
+        ("si_family", ctypes.c_ushort),
+        # Sized/aligned for the SOCKADDR_IN6 arm of the union
+        ("_align",    wt.ULONG * 7),
+    ]
+
+
+class _IP_ADDRESS_PREFIX(Structure):
+    _fields_ = [
+        ("Prefix",       _SOCKADDR_INET),
+        ("PrefixLength", c_ubyte),
+    ]
+
+
+class MIB_IPFORWARD_ROW2(Structure):
+    """Mirror of the Win32 MIB_IPFORWARD_ROW2 structure (netioapi.h)."""
+    _fields_ = [
+        ("InterfaceLuid",        c_ulonglong),
+        ("InterfaceIndex",       wt.DWORD),
+        ("DestinationPrefix",    _IP_ADDRESS_PREFIX),
+        ("NextHop",              _SOCKADDR_INET),
+        ("SitePrefixLength",     c_ubyte),
+        ("ValidLifetime",        wt.ULONG),
+        ("PreferredLifetime",    wt.ULONG),
+        ("Metric",               wt.ULONG),
+        ("Protocol",             wt.ULONG),
+        ("Loopback",             c_ubyte),
+        ("AutoconfigureAddress", c_ubyte),
+        ("Publish",              c_ubyte),
+        ("Immortal",             c_ubyte),
+        ("Age",                  wt.ULONG),
+        ("Origin",               wt.ULONG),
+    ]
+
+
+class _MIB_IPFORWARD_TABLE2(Structure):
+    _fields_ = [
+        ("NumEntries", wt.ULONG),
+        ("Table",      MIB_IPFORWARD_ROW2 * 1),
+    ]
+
+
+_iphlpapi = windll.iphlpapi
+
+_GetIfEntry2 = _iphlpapi.GetIfEntry2
+_GetIfEntry2.restype = wt.DWORD
+_GetIfEntry2.argtypes = [POINTER(MIB_IF_ROW2)]
+
+_GetAdaptersAddresses = _iphlpapi.GetAdaptersAddresses
+_GetAdaptersAddresses.restype = wt.ULONG
+_GetAdaptersAddresses.argtypes = [
+    wt.ULONG, wt.ULONG, c_void_p, c_void_p, POINTER(wt.ULONG),
+]
+
+_GetIpForwardTable2 = _iphlpapi.GetIpForwardTable2
+_GetIpForwardTable2.restype = wt.DWORD
+_GetIpForwardTable2.argtypes = [
+    ctypes.c_ushort, POINTER(POINTER(_MIB_IPFORWARD_TABLE2)),
+]
+
+_FreeMibTable = _iphlpapi.FreeMibTable
+_FreeMibTable.restype = None
+_FreeMibTable.argtypes = [c_void_p]
+
+# VOID CALLBACK (PVOID CallerContext, PMIB_IPINTERFACE_ROW Row,
+#                MIB_NOTIFICATION_TYPE NotificationType)
+_IP_INTERFACE_CHANGE_CALLBACK = ctypes.WINFUNCTYPE(
+    None, c_void_p, c_void_p, wt.ULONG
+)
+
+_NotifyIpInterfaceChange = _iphlpapi.NotifyIpInterfaceChange
+_NotifyIpInterfaceChange.restype = wt.DWORD
+_NotifyIpInterfaceChange.argtypes = [
+    ctypes.c_ushort, _IP_INTERFACE_CHANGE_CALLBACK, c_void_p,
+    wt.BOOL, POINTER(wt.HANDLE),
+]
+
+_CancelMibChangeNotify2 = _iphlpapi.CancelMibChangeNotify2
+_CancelMibChangeNotify2.restype = wt.DWORD
+_CancelMibChangeNotify2.argtypes = [wt.HANDLE]
+
+_ConvertInterfaceAliasToLuid = _iphlpapi.ConvertInterfaceAliasToLuid
+_ConvertInterfaceAliasToLuid.restype = wt.DWORD
+_ConvertInterfaceAliasToLuid.argtypes = [
+    wt.LPCWSTR, POINTER(c_ulonglong),
+]
+
+_ConvertInterfaceLuidToIndex = _iphlpapi.ConvertInterfaceLuidToIndex
+_ConvertInterfaceLuidToIndex.restype = wt.DWORD
+_ConvertInterfaceLuidToIndex.argtypes = [
+    POINTER(c_ulonglong), POINTER(wt.DWORD),
+]
+
+
+AdapterInfo = namedtuple(
+    "AdapterInfo", ["name", "description", "if_index", "is_up", "ipv4"]
+)
+
+
+def get_adapters_addresses():
+    """Enumerate adapters via GetAdaptersAddresses.
+
+    Returns a list of AdapterInfo (name, description, if_index, is_up,
+    ipv4) or None if the call fails.  One syscall replaces the old
+    PowerShell Get-NetAdapter subprocess.
+    """
+    flags = (_GAA_FLAG_SKIP_ANYCAST | _GAA_FLAG_SKIP_MULTICAST
+             | _GAA_FLAG_SKIP_DNS_SERVER)
+    size = wt.ULONG(16 * 1024)
+
+    for _ in range(3):
+        buf = (c_ubyte * size.value)()
+        ret = _GetAdaptersAddresses(
+            AF_INET, flags, None, cast(buf, c_void_p), byref(size)
+        )
+        if ret == NO_ERROR:
+            break
+        if ret != ERROR_BUFFER_OVERFLOW:
+            return None
+    else:
+        return None
+
+    adapters = []
+    current = cast(buf, POINTER(_IP_ADAPTER_ADDRESSES))
+    while current:
+        adapter = current.contents
+
+        ipv4 = None
+        unicast = adapter.FirstUnicastAddress
+        while unicast:
+            sockaddr = unicast.contents.Address.lpSockaddr
+            if sockaddr and sockaddr.contents.sin_family == AF_INET:
+                ipv4 = ".".join(str(b) for b in sockaddr.contents.sin_addr)
+                break
+            unicast = unicast.contents.Next
+
+        adapters.append(AdapterInfo(
+            name=adapter.FriendlyName,
+            description=adapter.Description or "",
+            if_index=adapter.IfIndex,
+            is_up=adapter.OperStatus == _IF_OPER_STATUS_UP,
+            ipv4=ipv4,
+        ))
+        current = adapter.Next
+    return adapters
+
+
+def alias_to_if_index(alias):
+    """Resolve an adapter friendly name to its current ifIndex, or None.
+
+    ConvertInterfaceAliasToLuid + ConvertInterfaceLuidToIndex resolve a
+    single adapter in microseconds — no full adapter enumeration.
+    """
+    luid = c_ulonglong()
+    if _ConvertInterfaceAliasToLuid(alias, byref(luid)) != NO_ERROR:
+        return None
+    index = wt.DWORD()
+    if _ConvertInterfaceLuidToIndex(byref(luid), byref(index)) != NO_ERROR:
+        return None
+    return index.value
+
+
+def register_interface_change(callback):
+    """Invoke *callback* (no args) on every IPv4 interface change.
+
+    The callback runs on a system thread pool thread; keep it cheap
+    (e.g. set a threading.Event).  Returns an opaque registration to
+    pass to unregister_interface_change(), or None if registration
+    failed.
+    """
+    def _trampoline(_context, _row, _notification_type):
+        try:
+            callback()
+        except Exception:
+            pass
+
+    c_callback = _IP_INTERFACE_CHANGE_CALLBACK(_trampoline)
+    handle = wt.HANDLE()
+    ret = _NotifyIpInterfaceChange(AF_INET, c_callback, None, False,
+                                   byref(handle))
+    if ret != NO_ERROR:
+        return None
+    # Keep the ctypes callback alive alongside the handle
+    return (handle, c_callback)
+
+
+def unregister_interface_change(registration):
+    """Cancel a registration from register_interface_change()."""
+    handle, _c_callback = registration
+    try:
+        _CancelMibChangeNotify2(handle)
+    except Exception:
+        pass
+
+
+DefaultRoute = namedtuple("DefaultRoute", ["if_index", "gateway", "metric"])
+
+
+def get_default_routes():
+    """Return IPv4 default routes (0.0.0.0/0) sorted by metric.
+
+    Each entry is a DefaultRoute(if_index, gateway, metric).  Returns
+    None if GetIpForwardTable2 fails.
+    """
+    table_ptr = POINTER(_MIB_IPFORWARD_TABLE2)()
+    if _GetIpForwardTable2(AF_INET, byref(table_ptr)) != NO_ERROR:
+        return None
+
+    try:
+        table = table_ptr.contents
+        n = table.NumEntries
+        rows = (MIB_IPFORWARD_ROW2 * n).from_address(
+            ctypes.addressof(table.Table)
+        )
+        routes = []
+        for row in rows:
+            if row.DestinationPrefix.PrefixLength != 0:
+                continue
+            gateway = ".".join(str(b) for b in row.NextHop.Ipv4.sin_addr)
+            if gateway == "0.0.0.0":
+                continue
+            routes.append(DefaultRoute(row.InterfaceIndex, gateway, row.Metric))
+        routes.sort(key=lambda r: r.metric)
+        return routes
+    finally:
+        _FreeMibTable(table_ptr)
+
+
+def get_if_counters(if_index):
+    """Return (bytes_in, bytes_out) for the given ifIndex, or None on failure.
+
+    Reads a single MIB_IF_ROW2 via GetIfEntry2 — O(1) in the number of
+    adapters, unlike the psutil pernic snapshot.
+    """
+    row = MIB_IF_ROW2()
+    row.InterfaceIndex = if_index
+    if _GetIfEntry2(byref(row)) != NO_ERROR:
+        return None
+    return row.InOctets, row.OutOctets
@@ -9,20 +9,38 @@ instant a packet is intercepted — no 200 ms polling delay.
 
 import ctypes
 import ctypes.wintypes as wt
+import socket
+import struct
+import time
+from array import array
 from ctypes import (
-    POINTER, Structure, addressof, byref, c_byte, cast, sizeof, windll,
+    POINTER, Structure, addressof, byref, c_byte, cast, sizeof,
+    string_at, windll,
 )
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 AF_INET = 2
+# Connected sockets only — excludes LISTEN/TIME_WAIT noise, so the
+# returned table is several times smaller than OWNER_PID_ALL.  Packets
+# we intercept always belong to a connected socket (accepted server
+# connections show up here as ESTABLISHED rows too).
+TCP_TABLE_OWNER_PID_CONNECTIONS = 4
+# Full table (incl. LISTEN/TIME_WAIT) — used by the connection tracker,
+# which must index listening sockets too
 TCP_TABLE_OWNER_PID_ALL = 5
 UDP_TABLE_OWNER_PID = 1
 NO_ERROR = 0
 ERROR_INSUFFICIENT_BUFFER = 122
 _MAX_RETRIES = 5
 
+# How long a fetched port->pid index stays valid.  Bursts of WinDivert
+# fallback lookups (several packets of the same new connection) share
+# one table fetch; anything older than this is re-fetched because the
+# connection being looked up may be newer than the snapshot.
+_INDEX_TTL = 0.25
+
 
 def _htons(port):
     """Host-order 16-bit port → network byte order."""
@@ -112,24 +130,50 @@ class _Buffer:
             self._size = new_size
 
 
-_tcp_buf = _Buffer()
-_udp_buf = _Buffer()
+def _probe_required_size(fn, table_class):
+    """Ask the API how big the table currently is (NULL-buffer probe).
+
+    Returns 0 if the probe fails; callers fall back to the default
+    buffer size.
+    """
+    dw_size = wt.DWORD(0)
+    try:
+        fn(None, byref(dw_size), False, AF_INET, table_class, 0)
+    except Exception:
+        return 0
+    return dw_size.value
+
+
+def _primed_buffer(fn, table_class):
+    """Allocate a buffer sized from the live table (plus 25% slack)."""
+    size = _probe_required_size(fn, table_class)
+    return _Buffer(size + size // 4) if size else _Buffer()
+
+
+_tcp_buf = _primed_buffer(_GetExtTcp, TCP_TABLE_OWNER_PID_CONNECTIONS)
+_udp_buf = _primed_buffer(_GetExtUdp, UDP_TABLE_OWNER_PID)
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# Port -> PID indexes (hash lookup instead of O(N) row scan per call)
 # ---------------------------------------------------------------------------
 
-def get_pid_for_tcp_port(port):
-    """Return the PID owning the given local TCP port (IPv4), or None."""
-    net_port = _htons(port)
+_tcp_index = {}
+_tcp_index_ts = 0.0
+_udp_index = {}
+_udp_index_ts = 0.0
+
+
+def _fetch_tcp_index():
+    """Fetch the TCP table and rebuild {net_port: pid}. None on failure."""
+    global _tcp_index, _tcp_index_ts
     buf = _tcp_buf
     dw_size = wt.DWORD(buf.size)
 
     for _ in range(_MAX_RETRIES):
         ret = _GetExtTcp(
             buf.ptr, byref(dw_size), False,
-            AF_INET, TCP_TABLE_OWNER_PID_ALL, 0,
+            AF_INET, TCP_TABLE_OWNER_PID_CONNECTIONS, 0,
         )
         if ret == NO_ERROR:
             break
@@ -143,19 +187,23 @@ def get_pid_for_tcp_port(port):
 
     table = cast(buf.ptr, POINTER(_TcpTable)).contents
     n = table.dwNumEntries
-    row_size = sizeof(_TcpRow)
-    base = addressof(table.table)
-    for i in range(n):
-        row = cast(base + i * row_size, POINTER(_TcpRow)).contents
-        if row.dwLocalPort == net_port:
-            pid = row.dwOwningPid
-            return pid if pid else None
-    return None
-
-
-def get_pid_for_udp_port(port):
-    """Return the PID owning the given local UDP port (IPv4), or None."""
-    net_port = _htons(port)
+    # View the rows as a flat uint32 array and slice out the port and
+    # pid columns at C speed — no ctypes row object per entry.
+    flat = array("I", string_at(addressof(table.table), n * sizeof(_TcpRow)))
+    index = {}
+    for port, pid in zip(flat[2::6], flat[5::6]):
+        # First row wins, matching the old linear-scan semantics
+        if port not in index:
+            index[port] = pid
+
+    _tcp_index = index
+    _tcp_index_ts = time.monotonic()
+    return index
+
+
+def _fetch_udp_index():
+    """Fetch the UDP table and rebuild {net_port: pid}. None on failure."""
+    global _udp_index, _udp_index_ts
     buf = _udp_buf
     dw_size = wt.DWORD(buf.size)
 
@@ -176,16 +224,137 @@ def get_pid_for_udp_port(port):
 
     table = cast(buf.ptr, POINTER(_UdpTable)).contents
     n = table.dwNumEntries
-    row_size = sizeof(_UdpRow)
-    base = addressof(table.table)
-    for i in range(n):
-        row = cast(base + i * row_size, POINTER(_UdpRow)).contents
-        if row.dwLocalPort == net_port:
-            pid = row.dwOwningPid
-            return pid if pid else None
+    flat = array("I", string_at(addressof(table.table), n * sizeof(_UdpRow)))
+    index = {}
+    for port, pid in zip(flat[1::3], flat[2::3]):
+        if port not in index:
+            index[port] = pid
+
+    _udp_index = index
+    _udp_index_ts = time.monotonic()
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Whole-table snapshots (for the connection tracker)
+# ---------------------------------------------------------------------------
+
+# These have their own buffers: the fallback-lookup buffers above are
+# used from the interceptor thread while the tracker snapshots here.
+_tcp_all_buf = _Buffer()
+_udp_all_buf = _Buffer()
+
+# Network-order uint32 -> dotted string, cached (the set of local
+# addresses is tiny and stable)
+_ip_str_cache = {}
+
+
+def _ip_to_str(addr):
+    s = _ip_str_cache.get(addr)
+    if s is None:
+        s = _ip_str_cache.setdefault(
+            addr, socket.inet_ntoa(struct.pack("<I", addr))
+        )
+    return s
+
+
+def _fetch_table(fn, table_class, table_type, buf):
+    """Fetch a table into *buf*, growing as needed. None on failure."""
+    dw_size = wt.DWORD(buf.size)
+    for _ in range(_MAX_RETRIES):
+        ret = fn(buf.ptr, byref(dw_size), False, AF_INET, table_class, 0)
+        if ret == NO_ERROR:
+            return cast(buf.ptr, POINTER(table_type)).contents
+        if ret == ERROR_INSUFFICIENT_BUFFER:
+            buf.grow(dw_size.value)
+            dw_size = wt.DWORD(buf.size)
+            continue
+        return None
     return None
 
 
-def get_pid_for_port(port):
-    """Try TCP first, then UDP. Returns PID or None."""
+def snapshot_connections():
+    """
+    Return [(local_ip, local_port, pid), ...] for every IPv4 TCP socket
+    (all states, including LISTEN) and UDP socket, or None if a fetch
+    fails.  One kernel call per table — far cheaper than psutil's
+    net_connections(), which builds a namedtuple per socket.
+    """
+    tcp_table = _fetch_table(
+        _GetExtTcp, TCP_TABLE_OWNER_PID_ALL, _TcpTable, _tcp_all_buf
+    )
+    udp_table = _fetch_table(
+        _GetExtUdp, UDP_TABLE_OWNER_PID, _UdpTable, _udp_all_buf
+    )
+    if tcp_table is None or udp_table is None:
+        return None
+
+    rows = []
+    append = rows.append
+    ip_str = _ip_to_str
+
+    n = tcp_table.dwNumEntries
+    flat = array("I", string_at(addressof(tcp_table.table), n * sizeof(_TcpRow)))
+    for addr, port, pid in zip(flat[1::6], flat[2::6], flat[5::6]):
+        if pid:
+            append((ip_str(addr), ((port >> 8) | (port << 8)) & 0xFFFF, pid))
+
+    n = udp_table.dwNumEntries
+    flat = array("I", string_at(addressof(udp_table.table), n * sizeof(_UdpRow)))
+    for addr, port, pid in zip(flat[0::3], flat[1::3], flat[2::3]):
+        if pid:
+            append((ip_str(addr), ((port >> 8) | (port << 8)) & 0xFFFF, pid))
+
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get_pid_for_tcp_port(port):
+    """Return the PID owning the given local TCP port (IPv4), or None."""
+    net_port = _htons(port)
+
+    # O(1) hit against the recent index
+    if time.monotonic() - _tcp_index_ts < _INDEX_TTL:
+        pid = _tcp_index.get(net_port)
+        if pid:
+            return pid
+        # Miss: the connection may be newer than the snapshot
+
+    index = _fetch_tcp_index()
+    if index is None:
+        return None
+    pid = index.get(net_port)
+    return pid if pid else None
+
+
+def get_pid_for_udp_port(port):
+    """Return the PID owning the given local UDP port (IPv4), or None."""
+    net_port = _htons(port)
+
+    if time.monotonic() - _udp_index_ts < _INDEX_TTL:
+        pid = _udp_index.get(net_port)
+        if pid:
+            return pid
+
+    index = _fetch_udp_index()
+    if index is None:
+        return None
+    pid = index.get(net_port)
+    return pid if pid else None
+
+
+def get_pid_for_port(port, proto=None):
+    """Return the PID owning the given local port, or None.
+
+    *proto* may be 'tcp' or 'udp' to query only that table — callers
+    that know the packet's protocol skip one full table fetch.  With no
+    hint, TCP is tried first, then UDP.
+    """
+    if proto == "tcp":
+        return get_pid_for_tcp_port(port)
+    if proto == "udp":
+        return get_pid_for_udp_port(port)
     return get_pid_for_tcp_port(port) or get_pid_for_udp_port(port)
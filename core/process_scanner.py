@@ -3,16 +3,34 @@ Enumerate running processes and extract their icons.
 Groups by executable path and filters out system noise.
 """
 
+import atexit
 import ctypes
 import ctypes.wintypes
+import functools
+import hashlib
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 import psutil
 from PIL import Image
 
 log = logging.getLogger(__name__)
 
+# psutil 6.0 dropped the per-PID create_time() reuse check from
+# process_iter(), which is the dominant cost of a scan on Windows.
+# Stale-PID windows of a single UI refresh are acceptable here.
+if psutil.version_info < (6, 0):
+    log.warning(
+        "psutil %s detected; process scanning is significantly faster "
+        "with psutil >= 6.0", psutil.__version__,
+    )
+
+# Bound once for except-clause dispatch inside the scan loops
+_PSUTIL_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
 # Processes to always hide from the list
 _SYSTEM_NOISE = {
     "system", "idle", "svchost.exe", "csrss.exe", "smss.exe",
@@ -29,16 +47,159 @@ _SYSTEM_NOISE = {
     "searchfilterhost.exe", "wmiprvse.exe",
 }
 
-# Icon cache: exe_path -> PIL.Image or None
-_icon_cache = {}
+# exe path -> display name ("C:\...\chrome.exe" -> "chrome").  The set
+# of unique exes barely changes between scans, so compute each once.
+_display_name_cache = {}
+
+
+def _display_name(exe):
+    name = _display_name_cache.get(exe)
+    if name is None:
+        name = _display_name_cache.setdefault(
+            exe, os.path.splitext(os.path.basename(exe))[0]
+        )
+    return name
+
+
+# Pre-lowercased system directory markers (exe paths are lowercased once
+# per process before the test)
+_WIN_SYSDIRS = ("\\windows\\system32\\", "\\windows\\syswow64\\")
+
+# Extracted icons persisted as PNGs so later launches skip the GDI work
+# entirely (lives next to config.json, same as the rest of app state)
+_ICON_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icon_cache"
+)
+
+# Resampling filter for icon downscale.  At a 32px target the output is
+# visually identical to LANCZOS at a fraction of the multiply-adds;
+# integer-ratio downscales use BOX instead (cheaper still, exact).
+_RESAMPLE = Image.Resampling.BILINEAR
+
+# ExtractIconExW / SHGetFileInfo / GDI rasterization are not safe to run
+# concurrently from several threads; serialize them and let the cheap
+# parts (PE reads warming the file cache, PNG decode) overlap instead
+_gdi_lock = threading.Lock()
+
+# ---------------------------------------------------------------------------
+# Win32 bindings — argtypes/restype declared once at import.  Without
+# them ctypes infers conversions on every call, and on 64-bit Python
+# HICON/HBITMAP handles returned as plain ints get truncated to 32 bits.
+# ---------------------------------------------------------------------------
+wt = ctypes.wintypes
+
+_user32 = ctypes.windll.user32
+_gdi32 = ctypes.windll.gdi32
+_shell32 = ctypes.windll.shell32
+
+_user32.IsWindowVisible.argtypes = [wt.HWND]
+_user32.IsWindowVisible.restype = wt.BOOL
+_user32.GetWindowTextLengthW.argtypes = [wt.HWND]
+_user32.GetWindowTextLengthW.restype = ctypes.c_int
+_user32.GetWindowTextW.argtypes = [wt.HWND, wt.LPWSTR, ctypes.c_int]
+_user32.GetWindowTextW.restype = ctypes.c_int
+_user32.GetWindowThreadProcessId.argtypes = [wt.HWND, ctypes.POINTER(wt.DWORD)]
+_user32.GetWindowThreadProcessId.restype = wt.DWORD
+_user32.DestroyIcon.argtypes = [wt.HICON]
+_user32.DestroyIcon.restype = wt.BOOL
+_user32.GetIconInfo.argtypes = [wt.HICON, ctypes.c_void_p]
+_user32.GetIconInfo.restype = wt.BOOL
+_user32.GetDC.argtypes = [wt.HWND]
+_user32.GetDC.restype = wt.HDC
+_user32.ReleaseDC.argtypes = [wt.HWND, wt.HDC]
+_user32.ReleaseDC.restype = ctypes.c_int
+_user32.DrawIconEx.argtypes = [
+    wt.HDC, ctypes.c_int, ctypes.c_int, wt.HICON,
+    ctypes.c_int, ctypes.c_int, wt.UINT, wt.HBRUSH, wt.UINT,
+]
+_user32.DrawIconEx.restype = wt.BOOL
+_user32.GetAncestor.argtypes = [wt.HWND, wt.UINT]
+_user32.GetAncestor.restype = wt.HWND
+# GetWindowLongPtrW only exists as an export on 64-bit user32; the
+# 32-bit macro form maps to GetWindowLongW
+try:
+    _GetWindowLongPtrW = _user32.GetWindowLongPtrW
+except AttributeError:
+    _GetWindowLongPtrW = _user32.GetWindowLongW
+_GetWindowLongPtrW.argtypes = [wt.HWND, ctypes.c_int]
+_GetWindowLongPtrW.restype = ctypes.c_ssize_t
+
+_gdi32.GetObjectW.argtypes = [wt.HANDLE, ctypes.c_int, ctypes.c_void_p]
+_gdi32.GetObjectW.restype = ctypes.c_int
+_gdi32.CreateCompatibleDC.argtypes = [wt.HDC]
+_gdi32.CreateCompatibleDC.restype = wt.HDC
+_gdi32.CreateDIBSection.argtypes = [
+    wt.HDC, ctypes.c_void_p, wt.UINT,
+    ctypes.POINTER(ctypes.c_void_p), wt.HANDLE, wt.DWORD,
+]
+_gdi32.CreateDIBSection.restype = wt.HBITMAP
+_gdi32.SelectObject.argtypes = [wt.HDC, wt.HANDLE]
+_gdi32.SelectObject.restype = wt.HANDLE
+_gdi32.DeleteObject.argtypes = [wt.HANDLE]
+_gdi32.DeleteObject.restype = wt.BOOL
+_gdi32.DeleteDC.argtypes = [wt.HDC]
+_gdi32.DeleteDC.restype = wt.BOOL
+
+_shell32.ExtractIconExW.argtypes = [
+    wt.LPCWSTR, ctypes.c_int,
+    ctypes.POINTER(wt.HICON), ctypes.POINTER(wt.HICON), wt.UINT,
+]
+_shell32.ExtractIconExW.restype = wt.UINT
+_shell32.SHGetFileInfoW.argtypes = [
+    wt.LPCWSTR, wt.DWORD, ctypes.c_void_p, wt.UINT, wt.UINT,
+]
+_shell32.SHGetFileInfoW.restype = ctypes.c_void_p  # DWORD_PTR
+
+_ntdll = ctypes.windll.ntdll
+_kernel32 = ctypes.windll.kernel32
+
+_ntdll.NtQuerySystemInformation.argtypes = [
+    ctypes.c_int, ctypes.c_void_p, wt.ULONG, ctypes.POINTER(wt.ULONG),
+]
+_ntdll.NtQuerySystemInformation.restype = wt.ULONG  # NTSTATUS
+
+_kernel32.OpenProcess.argtypes = [wt.DWORD, wt.BOOL, wt.DWORD]
+_kernel32.OpenProcess.restype = wt.HANDLE
+_kernel32.CloseHandle.argtypes = [wt.HANDLE]
+_kernel32.CloseHandle.restype = wt.BOOL
+_kernel32.QueryFullProcessImageNameW.argtypes = [
+    wt.HANDLE, wt.DWORD, wt.LPWSTR, ctypes.POINTER(wt.DWORD),
+]
+_kernel32.QueryFullProcessImageNameW.restype = wt.BOOL
+
+_SYSTEM_PROCESS_INFORMATION_CLASS = 5
+_STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+
+class _UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length",        wt.USHORT),  # bytes, not chars
+        ("MaximumLength", wt.USHORT),
+        ("Buffer",        ctypes.c_void_p),
+    ]
+
+
+class _SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Partial mirror of winternl.h — only the head of each entry; we hop
+    # between entries with NextEntryOffset.
+    _fields_ = [
+        ("NextEntryOffset", wt.ULONG),
+        ("NumberOfThreads", wt.ULONG),
+        ("Reserved1",       ctypes.c_byte * 48),
+        ("ImageName",       _UNICODE_STRING),
+        ("BasePriority",    ctypes.c_long),
+        ("UniqueProcessId", ctypes.c_void_p),
+    ]
 
 
 class ProcessInfo:
     """Represents a unique running application."""
-    __slots__ = ("name", "exe_path", "pids", "window_title")
+    __slots__ = ("name", "name_lc", "exe_path", "pids", "window_title")
 
     def __init__(self, name, exe_path, window_title=None):
         self.name = name
+        self.name_lc = name.lower()  # precomputed sort/filter key
         self.exe_path = exe_path
         self.pids = []
         self.window_title = window_title
@@ -47,90 +208,266 @@ class ProcessInfo:
         return f"ProcessInfo({self.name!r}, pids={len(self.pids)})"
 
 
+def _enum_processes_fast():
+    """
+    Enumerate (pid, name, exe) for all processes in one kernel transition
+    via NtQuerySystemInformation, then resolve exe paths with
+    QueryFullProcessImageNameW on limited-info handles (no admin needed).
+    Returns None on any failure so callers can fall back to psutil.
+    """
+    try:
+        length = 1 << 18
+        for _ in range(8):
+            buf = (ctypes.c_byte * length)()
+            needed = wt.ULONG(0)
+            status = _ntdll.NtQuerySystemInformation(
+                _SYSTEM_PROCESS_INFORMATION_CLASS, buf, length,
+                ctypes.byref(needed),
+            )
+            if status == 0:
+                break
+            if status != _STATUS_INFO_LENGTH_MISMATCH:
+                return None
+            # The table can grow between the probe and the real call
+            length = max(needed.value + (needed.value >> 2), length * 2)
+        else:
+            return None
+
+        results = []
+        base = ctypes.addressof(buf)
+        offset = 0
+        path_buf = ctypes.create_unicode_buffer(1024)
+        while True:
+            entry = _SYSTEM_PROCESS_INFORMATION.from_address(base + offset)
+            pid = entry.UniqueProcessId or 0
+            if pid not in (0, 4):
+                img = entry.ImageName
+                name = (
+                    ctypes.wstring_at(img.Buffer, img.Length // 2)
+                    if img.Buffer else ""
+                )
+                exe = None
+                handle = _kernel32.OpenProcess(
+                    _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+                )
+                if handle:
+                    try:
+                        # In/out: holds buffer capacity, returns length
+                        n_chars = wt.DWORD(1024)
+                        if _kernel32.QueryFullProcessImageNameW(
+                            handle, 0, path_buf, ctypes.byref(n_chars)
+                        ):
+                            exe = path_buf.value
+                    finally:
+                        _kernel32.CloseHandle(handle)
+                if name and exe:
+                    results.append((pid, name, exe))
+            next_offset = entry.NextEntryOffset
+            if not next_offset:
+                break
+            offset += next_offset
+        return results
+    except Exception as e:
+        log.debug(f"Native process enumeration failed: {e}")
+        return None
+
+
+def _enum_processes_psutil():
+    """Fallback enumeration: same (pid, name, exe) tuples via psutil."""
+    results = []
+    # Plain process_iter() skips psutil's as_dict() wrapper; oneshot()
+    # batches the underlying per-process queries for name()/exe().
+    for proc in psutil.process_iter():
+        try:
+            pid = proc.pid
+            if pid in (0, 4):
+                continue
+            with proc.oneshot():
+                name = proc.name() or ""
+                exe = proc.exe()
+        except _PSUTIL_ERRORS:
+            continue
+        results.append((pid, name, exe))
+    return results
+
+
 def scan_processes():
     """
     Return a sorted list of ProcessInfo objects for running user applications.
     Groups processes by exe path and deduplicates.
     """
-    seen = {}  # exe_path -> ProcessInfo
-    for proc in psutil.process_iter(["pid", "name", "exe"]):
-        try:
-            info = proc.info
-            name = (info["name"] or "").strip()
-            exe = info["exe"]
-            pid = info["pid"]
-
-            if not name or not exe or pid in (0, 4):
-                continue
-            if name.lower() in _SYSTEM_NOISE:
-                continue
-            # Skip processes in Windows system directories
-            exe_lower = exe.lower()
-            if "\\windows\\system32\\" in exe_lower or "\\windows\\syswow64\\" in exe_lower:
-                continue
+    entries = _enum_processes_fast()
+    if entries is None:
+        entries = _enum_processes_psutil()
 
-            if exe not in seen:
-                # Use the filename without extension as display name
-                display_name = os.path.splitext(os.path.basename(exe))[0]
-                seen[exe] = ProcessInfo(display_name, exe)
-            seen[exe].pids.append(pid)
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+    seen = {}  # exe_path -> ProcessInfo
+    # Hoist filter lookups out of the loop (attribute/global access per
+    # process adds up over a few hundred iterations)
+    is_noise = _SYSTEM_NOISE.__contains__
+    sys32, syswow = _WIN_SYSDIRS
+    for pid, name, exe in entries:
+        name = name.strip()
+        if not name or not exe:
+            continue
+        if is_noise(name.lower()):
+            continue
+        # Skip processes in Windows system directories
+        exe_lower = exe.lower()
+        if sys32 in exe_lower or syswow in exe_lower:
             continue
 
-    processes = sorted(seen.values(), key=lambda p: p.name.lower())
+        info = seen.get(exe)
+        if info is None:
+            # Use the filename without extension as display name
+            info = seen[exe] = ProcessInfo(_display_name(exe), exe)
+        info.pids.append(pid)
+
+    processes = sorted(seen.values(), key=attrgetter("name_lc"))
     return processes
 
 
+def _exe_mtime(exe_path):
+    try:
+        return os.path.getmtime(exe_path)
+    except OSError:
+        return 0.0
+
+
+def _disk_cache_path(exe_path, mtime, size):
+    digest = hashlib.sha1(
+        f"{exe_path}|{mtime}|{size}".encode("utf-8", "replace")
+    ).hexdigest()
+    return os.path.join(_ICON_CACHE_DIR, digest + ".png")
+
+
+class _IconExtractionFailed(Exception):
+    """Raised internally so lru_cache does not memoize failed extractions."""
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_icon_impl(exe_path, mtime, size):
+    # Disk cache from a previous run
+    disk_path = _disk_cache_path(exe_path, mtime, size)
+    try:
+        icon_image = Image.open(disk_path)
+        icon_image.load()
+        return icon_image
+    except OSError:
+        pass
+
+    with _gdi_lock:
+        icon_image = _extract_icon_win32(exe_path, size)
+        if icon_image is None:
+            icon_image = _extract_icon_shgetfileinfo(exe_path, size)
+    if icon_image is None:
+        raise _IconExtractionFailed
+    try:
+        os.makedirs(_ICON_CACHE_DIR, exist_ok=True)
+        icon_image.save(disk_path, "PNG")
+    except OSError as e:
+        log.debug(f"Could not persist icon for {exe_path}: {e}")
+    return icon_image
+
+
 def extract_icon(exe_path, size=32):
     """
     Extract the icon from an exe file and return a PIL Image.
     Tries ExtractIconExW first, then falls back to SHGetFileInfo
     (which handles UWP apps, Electron apps, and shell-associated icons).
-    Must be called from the main thread (GDI/COM requirement).
-    Returns None if all methods fail.
+    Thread-safe: the GDI-sensitive steps are serialized internally.
+    Cached in memory (bounded LRU keyed on the exe's mtime, so binary
+    updates invalidate) and on disk. Returns None if all methods fail.
     """
-    if exe_path in _icon_cache:
-        return _icon_cache[exe_path]
-
-    icon_image = _extract_icon_win32(exe_path, size)
-    if icon_image is None:
-        icon_image = _extract_icon_shgetfileinfo(exe_path, size)
-    # Only cache successful extractions so failures can be retried
-    if icon_image is not None:
-        _icon_cache[exe_path] = icon_image
-    return icon_image
+    try:
+        return _extract_icon_impl(exe_path, _exe_mtime(exe_path), size)
+    except _IconExtractionFailed:
+        return None
 
 
-def _get_windowed_pids():
+def prefetch_icons_for(proc_infos, size=32):
     """
-    Use EnumWindows to find PIDs that own a visible top-level window
-    with a non-empty title. Returns a dict mapping PID -> window title.
+    Warm the icon caches for the given ProcessInfo objects. Meant for
+    the view layer to call (off the UI thread) with just the rows it is
+    about to paint, rather than extracting icons for every scanned
+    process up front.
     """
-    user32 = ctypes.windll.user32
-    pid_titles = {}
+    extract_icons_batch([p.exe_path for p in proc_infos], size)
 
-    WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM)
+
+def extract_icons_batch(paths, size=32):
+    """
+    Extract icons for many exes at once, returning {exe_path: Image or None}.
+    The per-exe file reads and PNG-cache decodes overlap across a small
+    thread pool; the GDI steps still run one at a time.
+    """
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="icon") as pool:
+        return dict(zip(paths, pool.map(lambda p: extract_icon(p, size), paths)))
+
+
+# EnumWindows plumbing, built once at import.  Rebuilding the
+# WNDENUMPROC trampoline and allocating a unicode buffer per window
+# on every UI tick is pure overhead — the callback, title buffer and
+# PID out-param are all reusable (enumeration runs on one thread).
+_WNDENUMPROC = ctypes.WINFUNCTYPE(
+    ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
+)
+_user32.EnumWindows.argtypes = [_WNDENUMPROC, wt.LPARAM]
+_user32.EnumWindows.restype = wt.BOOL
+_TITLE_BUF_LEN = 512
+_enum_pid_titles = {}  # filled by the callback, reset per enumeration
+_enum_lock = threading.Lock()  # the shared dict allows one enumeration at a time
+
+_GA_ROOTOWNER = 3
+_GWL_EXSTYLE = -20
+_WS_EX_TOOLWINDOW = 0x00000080
+
+
+def _make_enum_callback():
+    user32 = _user32
+    buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
+    pid = ctypes.wintypes.DWORD()
+    byref_pid = ctypes.byref(pid)
+    pid_titles = _enum_pid_titles
 
     def _enum_callback(hwnd, _lparam):
         if not user32.IsWindowVisible(hwnd):
             return True
-        length = user32.GetWindowTextLengthW(hwnd)
-        if length == 0:
+        # Cheap property reads first: skip owned top-levels (Chrome and
+        # Electron apps create several per process) and tool windows
+        # before paying for the title and PID syscalls
+        if user32.GetAncestor(hwnd, _GA_ROOTOWNER) != hwnd:
+            return True
+        if _GetWindowLongPtrW(hwnd, _GWL_EXSTYLE) & _WS_EX_TOOLWINDOW:
+            return True
+        if user32.GetWindowTextLengthW(hwnd) == 0:
             return True
-        buf = ctypes.create_unicode_buffer(length + 1)
-        user32.GetWindowTextW(hwnd, buf, length + 1)
+        # Titles longer than the buffer are truncated by GetWindowTextW
+        user32.GetWindowTextW(hwnd, buf, _TITLE_BUF_LEN)
         title = buf.value.strip()
         if not title:
             return True
-        pid = ctypes.wintypes.DWORD()
-        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        user32.GetWindowThreadProcessId(hwnd, byref_pid)
         pid_val = pid.value
         if pid_val and pid_val not in pid_titles:
             pid_titles[pid_val] = title
         return True
 
-    user32.EnumWindows(WNDENUMPROC(_enum_callback), 0)
-    return pid_titles
+    return _WNDENUMPROC(_enum_callback)
+
+
+_enum_callback_c = _make_enum_callback()
+
+
+def _get_windowed_pids():
+    """
+    Use EnumWindows to find PIDs that own a visible top-level window
+    with a non-empty title. Returns a dict mapping PID -> window title.
+    """
+    with _enum_lock:
+        _enum_pid_titles.clear()
+        _user32.EnumWindows(_enum_callback_c, 0)
+        return dict(_enum_pid_titles)
 
 
 def scan_windowed_apps():
@@ -144,42 +481,46 @@ def scan_windowed_apps():
         return []
 
     seen = {}  # exe_path -> ProcessInfo
-    for proc in psutil.process_iter(["pid", "name", "exe"]):
+    is_noise = _SYSTEM_NOISE.__contains__
+    sys32, syswow = _WIN_SYSDIRS
+    for proc in psutil.process_iter():
         try:
-            info = proc.info
-            name = (info["name"] or "").strip()
-            exe = info["exe"]
-            pid = info["pid"]
-
-            if not name or not exe or pid in (0, 4):
+            pid = proc.pid
+            if pid in (0, 4):
                 continue
+            # Filter on PID before paying for name()/exe() queries
             if pid not in windowed_pids:
                 continue
-            if name.lower() in _SYSTEM_NOISE:
+            with proc.oneshot():
+                name = (proc.name() or "").strip()
+                exe = proc.exe()
+
+            if not name or not exe:
+                continue
+            if is_noise(name.lower()):
                 continue
             exe_lower = exe.lower()
-            if "\\windows\\system32\\" in exe_lower or "\\windows\\syswow64\\" in exe_lower:
+            if sys32 in exe_lower or syswow in exe_lower:
                 continue
 
             if exe not in seen:
                 window_title = windowed_pids.get(pid, None)
-                display_name = window_title or os.path.splitext(os.path.basename(exe))[0]
+                display_name = window_title or _display_name(exe)
                 seen[exe] = ProcessInfo(display_name, exe, window_title=window_title)
             seen[exe].pids.append(pid)
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        except _PSUTIL_ERRORS:
             continue
 
-    return sorted(seen.values(), key=lambda p: p.name.lower())
+    return sorted(seen.values(), key=attrgetter("name_lc"))
 
 
 def _extract_icon_win32(exe_path, size):
     """Use ExtractIconExW to pull an embedded icon from the exe."""
     try:
-        shell32 = ctypes.windll.shell32
         large = (ctypes.wintypes.HICON * 1)()
         small = (ctypes.wintypes.HICON * 1)()
 
-        count = shell32.ExtractIconExW(exe_path, 0, large, small, 1)
+        count = _shell32.ExtractIconExW(exe_path, 0, large, small, 1)
         if count == 0:
             return None
 
@@ -191,9 +532,9 @@ def _extract_icon_win32(exe_path, size):
             image = _hicon_to_pil(hicon, size)
             return image
         finally:
-            ctypes.windll.user32.DestroyIcon(hicon)
+            _user32.DestroyIcon(hicon)
             if large[0] and small[0]:
-                ctypes.windll.user32.DestroyIcon(small[0])
+                _user32.DestroyIcon(small[0])
     except Exception as e:
         log.debug(f"ExtractIconExW failed for {exe_path}: {e}")
         return None
@@ -222,17 +563,16 @@ def _extract_icon_shgetfileinfo(exe_path, size):
     with the Windows shell.
     """
     try:
-        shell32 = ctypes.windll.shell32
         info = _SHFILEINFOW()
 
         # Try large icon first
-        result = shell32.SHGetFileInfoW(
+        result = _shell32.SHGetFileInfoW(
             exe_path, 0, ctypes.byref(info), ctypes.sizeof(info),
             _SHGFI_ICON | _SHGFI_LARGEICON,
         )
         if not result or not info.hIcon:
             # Try small icon as last resort
-            result = shell32.SHGetFileInfoW(
+            result = _shell32.SHGetFileInfoW(
                 exe_path, 0, ctypes.byref(info), ctypes.sizeof(info),
                 _SHGFI_ICON | _SHGFI_SMALLICON,
             )
@@ -243,46 +583,127 @@ def _extract_icon_shgetfileinfo(exe_path, size):
             image = _hicon_to_pil(info.hIcon, size)
             return image
         finally:
-            ctypes.windll.user32.DestroyIcon(info.hIcon)
+            _user32.DestroyIcon(info.hIcon)
     except Exception as e:
         log.debug(f"SHGetFileInfo failed for {exe_path}: {e}")
         return None
 
 
+# GDI structures used by icon conversion — declared once; re-declaring
+# them per call repeats the ctypes field-layout work on a hot path
+class _ICONINFO(ctypes.Structure):
+    _fields_ = [
+        ("fIcon", ctypes.wintypes.BOOL),
+        ("xHotspot", ctypes.wintypes.DWORD),
+        ("yHotspot", ctypes.wintypes.DWORD),
+        ("hbmMask", ctypes.wintypes.HBITMAP),
+        ("hbmColor", ctypes.wintypes.HBITMAP),
+    ]
+
+
+class _BITMAP(ctypes.Structure):
+    _fields_ = [
+        ("bmType", ctypes.c_long),
+        ("bmWidth", ctypes.c_long),
+        ("bmHeight", ctypes.c_long),
+        ("bmWidthBytes", ctypes.c_long),
+        ("bmPlanes", ctypes.wintypes.WORD),
+        ("bmBitsPixel", ctypes.wintypes.WORD),
+        ("bmBits", ctypes.c_void_p),
+    ]
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.wintypes.DWORD),
+        ("biWidth", ctypes.c_long),
+        ("biHeight", ctypes.c_long),
+        ("biPlanes", ctypes.wintypes.WORD),
+        ("biBitCount", ctypes.wintypes.WORD),
+        ("biCompression", ctypes.wintypes.DWORD),
+        ("biSizeImage", ctypes.wintypes.DWORD),
+        ("biXPelsPerMeter", ctypes.c_long),
+        ("biYPelsPerMeter", ctypes.c_long),
+        ("biClrUsed", ctypes.wintypes.DWORD),
+        ("biClrImportant", ctypes.wintypes.DWORD),
+    ]
+
+
+_BITMAP_SIZE = ctypes.sizeof(_BITMAP)
+_BITMAPINFOHEADER_SIZE = ctypes.sizeof(_BITMAPINFOHEADER)
+
+
+# Shared drawing surface for icon conversion: one DC with a top-down
+# 32-bit DIB selected into it, created lazily and kept for the process.
+# (hdc, hbm_dib, bits, dim) — callers must hold _gdi_lock.
+_dib_pool = None
+
+
+@atexit.register
+def _release_dib_pool():
+    global _dib_pool
+    with _gdi_lock:
+        if _dib_pool is not None:
+            _gdi32.DeleteObject(_dib_pool[1])
+            _gdi32.DeleteDC(_dib_pool[0])
+            _dib_pool = None
+
+
+def _get_pooled_dib(width, height):
+    """
+    Return (hdc, bits, dim) for the shared DIB, at least width x height,
+    creating or growing it on demand. None if GDI allocation fails.
+    """
+    global _dib_pool
+    dim = max(width, height)
+    if _dib_pool is not None:
+        if _dib_pool[3] >= dim:
+            return _dib_pool[0], _dib_pool[2], _dib_pool[3]
+        # Unusually large icon — rebuild the pool bigger
+        _gdi32.DeleteObject(_dib_pool[1])
+        _gdi32.DeleteDC(_dib_pool[0])
+        _dib_pool = None
+    dim = max(dim, 256)
+
+    hdc_screen = _user32.GetDC(0)
+    hdc = _gdi32.CreateCompatibleDC(hdc_screen)
+    _user32.ReleaseDC(0, hdc_screen)
+    if not hdc:
+        return None
+
+    bmi = _BITMAPINFOHEADER()
+    bmi.biSize = _BITMAPINFOHEADER_SIZE
+    bmi.biWidth = dim
+    bmi.biHeight = -dim  # top-down
+    bmi.biPlanes = 1
+    bmi.biBitCount = 32
+    bmi.biCompression = 0  # BI_RGB
+
+    bits = ctypes.c_void_p()
+    hbm_dib = _gdi32.CreateDIBSection(
+        hdc, ctypes.byref(bmi), 0, ctypes.byref(bits), None, 0
+    )
+    if not hbm_dib or not bits:
+        _gdi32.DeleteDC(hdc)
+        return None
+
+    _gdi32.SelectObject(hdc, hbm_dib)
+    _dib_pool = (hdc, hbm_dib, bits, dim)
+    return hdc, bits, dim
+
+
 def _hicon_to_pil(hicon, size):
     """Convert a Windows HICON to a PIL Image."""
-    user32 = ctypes.windll.user32
-    gdi32 = ctypes.windll.gdi32
-
-    # GetIconInfo
-    class ICONINFO(ctypes.Structure):
-        _fields_ = [
-            ("fIcon", ctypes.wintypes.BOOL),
-            ("xHotspot", ctypes.wintypes.DWORD),
-            ("yHotspot", ctypes.wintypes.DWORD),
-            ("hbmMask", ctypes.wintypes.HBITMAP),
-            ("hbmColor", ctypes.wintypes.HBITMAP),
-        ]
-
-    icon_info = ICONINFO()
+    user32 = _user32
+    gdi32 = _gdi32
+
+    icon_info = _ICONINFO()
     if not user32.GetIconInfo(hicon, ctypes.byref(icon_info)):
         return None
 
-    # Get bitmap info
-    class BITMAP(ctypes.Structure):
-        _fields_ = [
-            ("bmType", ctypes.c_long),
-            ("bmWidth", ctypes.c_long),
-            ("bmHeight", ctypes.c_long),
-            ("bmWidthBytes", ctypes.c_long),
-            ("bmPlanes", ctypes.wintypes.WORD),
-            ("bmBitsPixel", ctypes.wintypes.WORD),
-            ("bmBits", ctypes.c_void_p),
-        ]
-
-    bmp = BITMAP()
+    bmp = _BITMAP()
     hbm = icon_info.hbmColor if icon_info.hbmColor else icon_info.hbmMask
-    gdi32.GetObjectW(hbm, ctypes.sizeof(BITMAP), ctypes.byref(bmp))
+    gdi32.GetObjectW(hbm, _BITMAP_SIZE, ctypes.byref(bmp))
 
     width = bmp.bmWidth
     height = bmp.bmHeight
@@ -292,67 +713,33 @@ def _hicon_to_pil(hicon, size):
             gdi32.DeleteObject(icon_info.hbmColor)
         return None
 
-    # Create a device context and bitmap to draw into
-    hdc_screen = user32.GetDC(0)
-    hdc = gdi32.CreateCompatibleDC(hdc_screen)
-
-    class BITMAPINFOHEADER(ctypes.Structure):
-        _fields_ = [
-            ("biSize", ctypes.wintypes.DWORD),
-            ("biWidth", ctypes.c_long),
-            ("biHeight", ctypes.c_long),
-            ("biPlanes", ctypes.wintypes.WORD),
-            ("biBitCount", ctypes.wintypes.WORD),
-            ("biCompression", ctypes.wintypes.DWORD),
-            ("biSizeImage", ctypes.wintypes.DWORD),
-            ("biXPelsPerMeter", ctypes.c_long),
-            ("biYPelsPerMeter", ctypes.c_long),
-            ("biClrUsed", ctypes.wintypes.DWORD),
-            ("biClrImportant", ctypes.wintypes.DWORD),
-        ]
-
-    bmi = BITMAPINFOHEADER()
-    bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-    bmi.biWidth = width
-    bmi.biHeight = -height  # top-down
-    bmi.biPlanes = 1
-    bmi.biBitCount = 32
-    bmi.biCompression = 0  # BI_RGB
-
-    bits = ctypes.c_void_p()
-    hbm_dib = gdi32.CreateDIBSection(
-        hdc, ctypes.byref(bmi), 0, ctypes.byref(bits), None, 0
-    )
-
-    if not hbm_dib or not bits:
-        gdi32.DeleteDC(hdc)
-        user32.ReleaseDC(0, hdc_screen)
+    # Draw into the pooled DIB instead of allocating one per icon
+    pooled = _get_pooled_dib(width, height)
+    if pooled is None:
         gdi32.DeleteObject(icon_info.hbmMask)
         if icon_info.hbmColor:
             gdi32.DeleteObject(icon_info.hbmColor)
         return None
+    hdc, bits, dim = pooled
+    stride = dim * 4
 
-    old_bm = gdi32.SelectObject(hdc, hbm_dib)
-
-    # Draw the icon
+    # Zero the region first — DrawIconEx blends over whatever the last
+    # icon left behind, and a memset is far cheaper than a fresh DIB
+    ctypes.memset(bits, 0, stride * height)
     user32.DrawIconEx(hdc, 0, 0, hicon, width, height, 0, 0, 0x0003)  # DI_NORMAL
 
-    # Copy pixel data
-    buf_size = width * height * 4
-    buf = (ctypes.c_ubyte * buf_size)()
-    ctypes.memmove(buf, bits, buf_size)
-
-    # Convert BGRA to RGBA using PIL channel swap (much faster than byte loop)
-    image = Image.frombytes("RGBA", (width, height), bytes(buf))
-    b, g, r, a = image.split()
-    image = Image.merge("RGBA", (r, g, b, a))
-    image = image.resize((size, size), Image.Resampling.LANCZOS)
-
-    # Cleanup
-    gdi32.SelectObject(hdc, old_bm)
-    gdi32.DeleteObject(hbm_dib)
-    gdi32.DeleteDC(hdc)
-    user32.ReleaseDC(0, hdc_screen)
+    # Snapshot the pixels in one copy; the pooled DIB is wider than the
+    # icon, so hand Pillow the row stride along with the raw BGRA data
+    pixels = ctypes.string_at(bits, stride * height)
+    image = Image.frombuffer("RGBA", (width, height), pixels,
+                             "raw", "BGRA", stride, 1)
+    if (width, height) != (size, size):
+        if width % size == 0 and height % size == 0:
+            image = image.resize((size, size), Image.Resampling.BOX)
+        else:
+            image = image.resize((size, size), _RESAMPLE)
+
+    # Only the per-icon bitmaps need cleanup; the DC/DIB stay pooled
     gdi32.DeleteObject(icon_info.hbmMask)
     if icon_info.hbmColor:
         gdi32.DeleteObject(icon_info.hbmColor)
@@ -9,9 +9,11 @@ Uses three threads:
    return traffic
 """
 
+import ctypes
 import logging
 import os
 import platform
+import socket
 import subprocess
 import threading
 import time
@@ -23,7 +25,7 @@ try:
 except ImportError:
     pydivert = None
 
-from core.port_lookup import get_pid_for_tcp_port, get_pid_for_udp_port
+from core.port_lookup import get_pid_for_port, snapshot_connections
 
 log = logging.getLogger(__name__)
 
@@ -68,6 +70,10 @@ CONN_POLL_INTERVAL = 0.2
 # How many tracker cycles between NAT table cleanups
 NAT_CLEANUP_EVERY = 50  # ~10 seconds at 0.2s interval
 
+# Rebuild the connection tables at least this often even when the
+# snapshot hash says nothing changed (safety net against collisions)
+CONN_FORCE_REBUILD_EVERY = 25  # ~5 seconds at 0.2s interval
+
 
 WINDIVERT_SERVICE_NAMES = ("WinDivert", "WinDivert1.3", "WinDivert14", "WinDivert1.4")
 
@@ -150,6 +156,132 @@ def _norm_path(p):
     return os.path.normcase(p) if p else p
 
 
+class _WINDIVERT_ADDRESS(ctypes.Structure):
+    # WinDivert 1.3 ABI — the DLL pydivert 2.1 bundles (matches
+    # pydivert's own WinDivertAddress).  WinDivert 1.4 changed
+    # WINDIVERT_ADDRESS to start with an INT64 Timestamp plus flag
+    # bits; dropping in a newer DLL without updating this layout means
+    # WinDivertRecv writes past the end of this 9-byte struct.
+    _fields_ = [
+        ("IfIdx",     ctypes.c_uint32),
+        ("SubIfIdx",  ctypes.c_uint32),
+        ("Direction", ctypes.c_uint8),
+    ]
+
+
+# Cached (recv, send) DLL entry points, or None when binding failed.
+# () means "not attempted yet".
+_raw_api = ()
+
+
+def _bind_raw_api():
+    """Bind WinDivertRecv/WinDivertSend straight from the DLL pydivert
+    already loaded.  Calling the entry points directly skips pydivert's
+    per-packet Packet construction and property descriptors; pydivert is
+    still used to open the handle and parse the filter.  Returns
+    (recv, send) or None if binding fails (the loops then fall back to
+    the pydivert Packet path).
+    """
+    global _raw_api
+    if _raw_api == ():
+        try:
+            from pydivert import windivert_dll
+            dll_dir = os.path.dirname(os.path.abspath(windivert_dll.__file__))
+            arch = "64" if platform.architecture()[0] == "64bit" else "32"
+            dll = ctypes.WinDLL(os.path.join(dll_dir, f"WinDivert{arch}.dll"))
+            argtypes = [
+                ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint,
+                ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint),
+            ]
+            recv = dll.WinDivertRecv
+            recv.argtypes = argtypes
+            recv.restype = ctypes.c_int
+            send = dll.WinDivertSend
+            send.argtypes = argtypes
+            send.restype = ctypes.c_int
+            _raw_api = (recv, send)
+        except Exception as e:
+            log.debug(f"Raw WinDivert binding unavailable: {e}")
+            _raw_api = None
+    return _raw_api
+
+
+_THREAD_PRIORITY_ABOVE_NORMAL = 1
+
+
+def _boost_thread_priority():
+    """Raise the calling thread's priority one notch.
+
+    The interceptor threads sit between the kernel and the network; a
+    scheduling delay there is added packet latency.  ABOVE_NORMAL keeps
+    them ahead of the UI without starving anything.
+    """
+    try:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(
+            kernel32.GetCurrentThread(), _THREAD_PRIORITY_ABOVE_NORMAL
+        )
+    except Exception:
+        pass
+
+
+# Dotted string -> packed network-order bytes, cached (only local
+# interface addresses ever pass through here)
+_aton_cache = {}
+
+
+def _aton(ip):
+    b = _aton_cache.get(ip)
+    if b is None:
+        b = _aton_cache.setdefault(ip, socket.inet_aton(ip))
+    return b
+
+
+def _pack_ip_port(ip, port):
+    """(dotted IPv4, port) -> single int key for the connection table."""
+    return (int.from_bytes(_aton(ip), "big") << 16) | port
+
+
+def _fixup_csum(raw, csum_off, old_hi, old_lo, new_hi, new_lo):
+    """RFC 1624 incremental one's-complement checksum update for a 4-byte
+    address change.  A zero field is left alone — it means checksum
+    offload (IP/TCP) or 'no checksum' (UDP), and must stay zero."""
+    csum = (raw[csum_off] << 8) | raw[csum_off + 1]
+    if csum == 0:
+        return
+    s = ((~csum & 0xFFFF) + (~old_hi & 0xFFFF) + (~old_lo & 0xFFFF)
+         + new_hi + new_lo)
+    while s >> 16:
+        s = (s & 0xFFFF) + (s >> 16)
+    csum = ~s & 0xFFFF
+    raw[csum_off] = csum >> 8
+    raw[csum_off + 1] = csum & 0xFF
+
+
+def _rewrite_ip_inplace(raw, offset, new_ip):
+    """Rewrite the 4-byte IPv4 address at *offset* (12 = src, 16 = dst)
+    directly in the packet buffer, patching the IP header checksum and
+    the TCP/UDP checksum (whose pseudo-header covers both addresses)
+    incrementally — ~5 adds instead of a full-packet recomputation."""
+    old_hi = (raw[offset] << 8) | raw[offset + 1]
+    old_lo = (raw[offset + 2] << 8) | raw[offset + 3]
+    new_hi = (new_ip[0] << 8) | new_ip[1]
+    new_lo = (new_ip[2] << 8) | new_ip[3]
+    if old_hi == new_hi and old_lo == new_lo:
+        return
+    raw[offset] = new_ip[0]
+    raw[offset + 1] = new_ip[1]
+    raw[offset + 2] = new_ip[2]
+    raw[offset + 3] = new_ip[3]
+    _fixup_csum(raw, 10, old_hi, old_lo, new_hi, new_lo)
+    ihl = (raw[0] & 0x0F) * 4
+    proto = raw[9]
+    if proto == 6:      # TCP
+        _fixup_csum(raw, ihl + 16, old_hi, old_lo, new_hi, new_lo)
+    elif proto == 17:   # UDP
+        _fixup_csum(raw, ihl + 6, old_hi, old_lo, new_hi, new_lo)
+
+
 class SplitEngine:
     """
     Per-application split tunneling engine.
@@ -176,19 +308,42 @@ class SplitEngine:
         self._default_gateway = None
         self._toggled_apps = frozenset()
 
+        # Mode dispatch, precomputed (see _refresh_mode_cache): in both
+        # modes the IP that means "already on the right interface" is
+        # also the IP toggled traffic gets rewritten to
+        self._target_ip = None
+        self._target_ip_packed = None
+        self._target_if_index = None
+
         # Connection tracking tables (atomically swapped, read without lock):
-        #   _conn_table: (local_ip, local_port) -> exe_path
+        #   _conn_table: (local_ip_u32 << 16) | local_port -> exe_path
+        #                (packed int key: one C-level hash, no per-packet
+        #                tuple or string hashing)
         #   _port_table: local_port -> exe_path
         self._conn_table = {}
         self._port_table = {}
 
-        # PID -> exe_path cache (accessed from tracker + interceptor threads;
+        # Hot-path decision set: local ports currently owned by a
+        # toggled exe.  Rebuilt by the tracker, read lock-free by the
+        # outbound interceptor — one int membership test per packet
+        # instead of chained dict lookups on (ip, port) tuples.
+        self._split_ports = frozenset()
+
+        # Snapshot digest for skip-when-unchanged; None forces a rebuild
+        self._conn_digest = None
+
+        # PID -> (psutil.Process, exe_path) cache (accessed from tracker +
+        # interceptor threads;
         # individual dict operations are GIL-safe in CPython)
         self._pid_cache = {}
 
         # NAT table for return traffic (read without lock, write with lock):
-        #   key:   (remote_ip, remote_port, local_port)
-        #   value: (original_local_ip, original_if_index)
+        #   key:   (remote_port << 16) | local_port  — a single small int,
+        #          so inbound lookups hash 8 bytes instead of a 3-tuple
+        #          of Python objects allocated per packet
+        #   value: (remote_ip, original_local_ip_packed, original_if_index);
+        #          remote_ip disambiguates the rare case of two remotes
+        #          sharing the same port pair
         self._nat_table = {}
         self._nat_lock = threading.Lock()
 
@@ -238,10 +393,13 @@ class SplitEngine:
         self._default_if_index = default_if_index
         self._default_gateway = default_gateway
         self._toggled_apps = frozenset(_norm_path(p) for p in (toggled_apps or []))
+        self._refresh_mode_cache()
 
         self._stop_event.clear()
         self._conn_table = {}
         self._port_table = {}
+        self._split_ports = frozenset()
+        self._conn_digest = None
         self._pid_cache = {}
         self._nat_table = {}
         self._startup_error = None
@@ -338,94 +496,166 @@ class SplitEngine:
     def update_policy(self, toggled_apps):
         """Live-update which apps are split. Thread-safe via atomic swap."""
         self._toggled_apps = frozenset(_norm_path(p) for p in toggled_apps)
+        # The port decision set is derived from the toggle set; force the
+        # tracker to rebuild it on its next cycle
+        self._conn_digest = None
         log.info(f"Policy updated: {len(self._toggled_apps)} toggled apps")
 
     def update_mode(self, mode):
         """Update the tunnel mode."""
         self._mode = mode
+        self._refresh_mode_cache()
+
+    def _refresh_mode_cache(self):
+        """Precompute the per-packet dispatch values for the current mode.
+
+        vpn_default: toggled apps are rewritten onto the default
+        interface, and packets already sourced from default_ip pass.
+        direct_default: the same with the VPN interface.  Either way a
+        single IP covers both the skip test and the rewrite target, so
+        the hot loop never compares the mode string per packet.
+        """
+        if self._mode == "vpn_default":
+            self._target_ip = self._default_ip
+            self._target_if_index = self._default_if_index
+        else:
+            self._target_ip = self._vpn_ip
+            self._target_if_index = self._vpn_if_index
+        self._target_ip_packed = (
+            _aton(self._target_ip) if self._target_ip else None
+        )
 
     # ------------------------------------------------------------------
     # Connection Tracker Thread
     # ------------------------------------------------------------------
 
     def _resolve_exe(self, pid):
-        """Resolve PID to normalized exe path, with caching."""
-        exe = self._pid_cache.get(pid)
-        if exe is not None:
-            return exe
+        """Resolve PID to normalized exe path, with caching.
+
+        The cache keeps the psutil.Process object alongside the path, so
+        repeat cycles reuse its open handle instead of paying
+        OpenProcess/NtQueryInformationProcess again.  psutil pins the
+        Process to its create_time, so a recycled PID that reappears
+        after eviction gets a fresh (correct) Process.
+        """
+        entry = self._pid_cache.get(pid)
+        if entry is not None:
+            return entry[1]
         try:
             proc = psutil.Process(pid)
-            raw = proc.exe()
+            with proc.oneshot():
+                raw = proc.exe()
             if raw:
                 exe = _norm_path(raw)
-                self._pid_cache[pid] = exe
+                self._pid_cache[pid] = (proc, exe)
                 return exe
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
         return None
 
-    def _resolve_port_exe(self, port):
+    def _resolve_port_exe(self, port, proto=None):
         """Synchronous port→exe lookup via Windows IP Helper API.
 
         Called from the interceptor thread when the connection tracker
         hasn't indexed a port yet (e.g. brand-new TCP SYN).  Queries
         GetExtendedTcpTable / GetExtendedUdpTable directly so there is
-        no polling delay.
+        no polling delay.  Pass *proto* ('tcp'/'udp') when known so only
+        one table is fetched.
         """
         try:
-            pid = get_pid_for_tcp_port(port)
-            if pid is None:
-                pid = get_pid_for_udp_port(port)
+            pid = get_pid_for_port(port, proto)
             if pid:
                 return self._resolve_exe(pid)
         except Exception:
             pass
         return None
 
+    def _snapshot_connections(self):
+        """One (ip, port, pid) row per local socket, cheapest source first.
+
+        GetExtendedTcpTable/GetExtendedUdpTable via core.port_lookup is
+        one kernel call per table; psutil.net_connections() is the
+        fallback, paying a namedtuple per socket.
+        """
+        rows = snapshot_connections()
+        if rows is None:
+            rows = [
+                (conn.laddr.ip, conn.laddr.port, conn.pid)
+                for conn in psutil.net_connections(kind="inet")
+                if conn.laddr and conn.pid
+            ]
+        return rows
+
     def _connection_tracker_loop(self):
-        """Poll psutil to maintain a mapping of local sockets to process exe paths."""
+        """Maintain the mapping of local sockets to process exe paths."""
         cycles = 0
+        unchanged_cycles = 0
         while not self._stop_event.is_set():
             try:
+                rows = self._snapshot_connections()
+
+                # In steady state the socket set barely changes; hashing
+                # the snapshot is O(N) in C and skips the whole dict
+                # rebuild plus per-PID resolution on idle cycles
+                digest = hash(tuple(rows))
+                unchanged_cycles += 1
+                if (digest == self._conn_digest
+                        and unchanged_cycles < CONN_FORCE_REBUILD_EVERY):
+                    cycles += 1
+                    if cycles >= NAT_CLEANUP_EVERY:
+                        cycles = 0
+                        self.cleanup_nat_table()
+                    self._stop_event.wait(CONN_POLL_INTERVAL)
+                    continue
+                self._conn_digest = digest
+                unchanged_cycles = 0
+
                 new_table = {}
                 new_port_table = {}
                 alive_pids = set()
 
-                for conn in psutil.net_connections(kind="inet"):
-                    if not conn.laddr or not conn.pid:
-                        continue
-
-                    alive_pids.add(conn.pid)
-                    exe = self._resolve_exe(conn.pid)
+                for ip, port, pid in rows:
+                    alive_pids.add(pid)
+                    exe = self._resolve_exe(pid)
                     if not exe:
                         continue
 
-                    ip = conn.laddr.ip
-                    port = conn.laddr.port
-
-                    # Primary table: exact (ip, port) -> exe
-                    new_table[(ip, port)] = exe
-
-                    # For sockets bound to 0.0.0.0 / ::, also index under
-                    # the actual interface IPs so packets match
+                    # For sockets bound to 0.0.0.0 / ::, index under the
+                    # actual interface IPs so packets match; otherwise
+                    # exact packed (ip, port) -> exe.  (IPv6 sockets have
+                    # no packed form; the port table still covers them.)
                     if ip in ("0.0.0.0", "::"):
                         if self._vpn_ip:
-                            new_table[(self._vpn_ip, port)] = exe
+                            new_table[_pack_ip_port(self._vpn_ip, port)] = exe
                         if self._default_ip:
-                            new_table[(self._default_ip, port)] = exe
+                            new_table[_pack_ip_port(self._default_ip, port)] = exe
+                    elif ":" not in ip:
+                        new_table[_pack_ip_port(ip, port)] = exe
 
                     # Port-only fallback (ephemeral ports are unique enough)
                     new_port_table[port] = exe
 
+                # Derive the hot-path decision set: ports whose owner is
+                # currently toggled
+                toggled = self._toggled_apps
+                new_split_ports = frozenset(
+                    port for port, exe in new_port_table.items()
+                    if exe in toggled
+                )
+
                 # Atomic swap — interceptors read these without locks
                 self._conn_table = new_table
                 self._port_table = new_port_table
+                self._split_ports = new_split_ports
 
-                # Prune PID cache of dead processes
-                self._pid_cache = {
-                    pid: exe for pid, exe in self._pid_cache.items()
-                    if pid in alive_pids
-                }
+                # Prune PID cache of dead processes in place — rebuilding
+                # the dict each cycle reallocated every entry just to
+                # drop a few dead PIDs (individual dict ops are GIL-safe
+                # for the interceptor readers)
+                cache = self._pid_cache
+                dead = [pid for pid in cache if pid not in alive_pids]
+                for pid in dead:
+                    del cache[pid]
 
             except Exception as e:
                 log.debug(f"Connection tracker error: {e}")
@@ -444,6 +674,7 @@ class SplitEngine:
 
     def _outbound_interceptor_loop(self):
         """Intercept outbound packets and rewrite source IP based on policy."""
+        _boost_thread_priority()
         # Filter excludes loopback at kernel level — never reaches Python
         try:
             w = pydivert.WinDivert(
@@ -469,92 +700,172 @@ class SplitEngine:
         except threading.BrokenBarrierError:
             pass
 
+        api = _bind_raw_api()
+        handle = getattr(w, "_handle", None)
+        try:
+            if api and handle is not None:
+                self._outbound_raw_loop(handle, api)
+            else:
+                self._outbound_packet_loop(w)
+        finally:
+            with self._handle_lock:
+                self._outbound_handle = None
+            try:
+                w.close()
+            except Exception:
+                pass
+
+    def _outbound_raw_loop(self, handle, api):
+        """Per-packet work against the raw buffer: one preallocated
+        buffer and WINDIVERT_ADDRESS reused across iterations, header
+        fields read straight out of the bytes — no Packet object."""
+        recv_fn, send_fn = api
+        buf = (ctypes.c_ubyte * 65535)()
+        raw_full = memoryview(buf)
+        addr = _WINDIVERT_ADDRESS()
+        addr_ref = ctypes.byref(addr)
+        recv_len = ctypes.c_uint(0)
+        recv_len_ref = ctypes.byref(recv_len)
+        stop = self._stop_event.is_set
+        nat_lock = self._nat_lock
+
+        # One exception handler around the whole loop keeps the
+        # per-packet path straight-line; stop is only checked when recv
+        # fails, which is how stop() unblocks us (it closes the handle)
+        while not stop():
+            try:
+                while True:
+                    if not recv_fn(handle, buf, 65535, addr_ref, recv_len_ref):
+                        if stop():
+                            return
+                        continue
+                    n = recv_len.value
+                    raw = raw_full[:n]
+
+                    # FAST PATH: already sourced from the target interface
+                    if raw[12:16] == self._target_ip_packed:
+                        send_fn(handle, buf, n, addr_ref, None)
+                        continue
+
+                    ihl = (raw[0] & 0x0F) * 4
+                    src_port = (raw[ihl] << 8) | raw[ihl + 1]
+
+                    # MEDIUM PATH: port decision set, then known-port pass
+                    if src_port not in self._split_ports:
+                        if src_port in self._port_table:
+                            send_fn(handle, buf, n, addr_ref, None)
+                            continue
+                        exe = self._conn_table.get(
+                            (int.from_bytes(bytes(raw[12:16]), "big") << 16)
+                            | src_port
+                        )
+                        if exe is None:
+                            exe = self._resolve_port_exe(
+                                src_port, "tcp" if raw[9] == 6 else "udp"
+                            )
+                        if not exe or exe not in self._toggled_apps:
+                            send_fn(handle, buf, n, addr_ref, None)
+                            continue
+
+                    # SLOW PATH: save NAT state, rewrite src, redirect
+                    dst_port = (raw[ihl + 2] << 8) | raw[ihl + 3]
+                    with nat_lock:
+                        self._nat_table[(dst_port << 16) | src_port] = (
+                            bytes(raw[16:20]), bytes(raw[12:16]), addr.IfIdx
+                        )
+                    _rewrite_ip_inplace(raw, 12, self._target_ip_packed)
+                    if self._target_if_index is not None:
+                        addr.IfIdx = self._target_if_index
+                        addr.SubIfIdx = 0
+                    send_fn(handle, buf, n, addr_ref, None)
+            except Exception as e:
+                if stop():
+                    return
+                log.debug(f"Outbound packet error: {e}")
+
+    def _outbound_packet_loop(self, w):
+        """Fallback loop through pydivert Packet objects."""
         # Cache instance attrs as locals — avoids self.X dict lookup per packet
         send = w.send
         recv = w.recv
         stop = self._stop_event.is_set
 
-        try:
-            while not stop():
-                try:
+        # One exception handler around the whole loop keeps the
+        # per-packet path straight-line; recv raising (handle closed by
+        # stop()) lands in the same branch as packet errors
+        while not stop():
+            try:
+                while True:
                     packet = recv()
-                except Exception:
-                    if stop():
-                        break
-                    continue
-                if packet is None:
-                    continue
 
-                try:
                     src_ip = packet.src_addr
                     src_port = packet.src_port
 
                     # ---- FAST PATH: skip packets already on the right iface ----
-                    # In vpn_default mode, packets with src=default_ip are
-                    # already direct (includes VPN tunnel traffic). Skip.
-                    # In direct_default mode, packets with src=vpn_ip are
-                    # already on VPN. Skip.
-                    mode = self._mode
-                    if mode == "vpn_default":
-                        if src_ip == self._default_ip:
+                    # Precomputed per mode: packets already sourced from
+                    # the target interface IP pass untouched (in
+                    # vpn_default that includes the VPN tunnel traffic
+                    # itself).  One string compare, no mode branch.
+                    if src_ip == self._target_ip:
+                        send(packet)
+                        continue
+
+                    # ---- MEDIUM PATH: is this port owned by a toggled app? ----
+                    # One int membership test on the tracker-built decision
+                    # set covers the common case; ports known to belong to
+                    # untoggled apps pass straight through.  Lock-free
+                    # reads of atomically-swapped sets/dicts (GIL).
+                    if src_port not in self._split_ports:
+                        if src_port in self._port_table:
                             send(packet)
                             continue
-                    elif mode == "direct_default":
-                        if src_ip == self._vpn_ip:
+                        # Unknown port: synchronous fallback against the
+                        # Windows TCP/UDP table.  Eliminates the race
+                        # where the tracker hasn't polled yet for a
+                        # brand-new connection (e.g. the very first SYN
+                        # packet).  The filter only admits tcp/udp, so
+                        # the protocol hint saves one table fetch.
+                        exe = self._conn_table.get(_pack_ip_port(src_ip, src_port))
+                        if exe is None:
+                            # Protocol straight from the IPv4 header byte
+                            # (offset 9) — packet.tcp would construct a
+                            # full parsed-header object just for this
+                            exe = self._resolve_port_exe(
+                                src_port,
+                                "tcp" if packet.raw[9] == 6 else "udp",
+                            )
+                        if not exe or exe not in self._toggled_apps:
                             send(packet)
                             continue
 
-                    # ---- MEDIUM PATH: look up process for this connection ----
-                    # Lock-free reads of atomically-swapped dicts (GIL)
-                    exe = self._conn_table.get((src_ip, src_port))
-                    if exe is None:
-                        exe = self._port_table.get(src_port)
-                    if exe is None:
-                        # Synchronous fallback: query Windows TCP/UDP
-                        # table directly.  Eliminates the race where the
-                        # tracker hasn't polled yet for a brand-new
-                        # connection (e.g. the very first SYN packet).
-                        exe = self._resolve_port_exe(src_port)
-                    if not exe or exe not in self._toggled_apps:
-                        send(packet)
-                        continue
-
                     # ---- SLOW PATH: rewrite packet for toggled app ----
-                    dst_ip = packet.dst_addr
                     dst_port = packet.dst_port
-
-                    if mode == "vpn_default":
-                        new_src_ip = self._default_ip
-                        target_if_index = self._default_if_index
-                    else:
-                        new_src_ip = self._vpn_ip
-                        target_if_index = self._vpn_if_index
+                    target_if_index = self._target_if_index
 
                     # Save original src IP and interface for inbound NAT
+                    # (remote address kept packed, matching the raw loop)
                     orig_if_idx = packet.interface[0]
-                    nat_key = (dst_ip, dst_port, src_port)
+                    nat_key = (dst_port << 16) | src_port
                     with self._nat_lock:
-                        self._nat_table[nat_key] = (src_ip, orig_if_idx)
+                        self._nat_table[nat_key] = (
+                            bytes(packet.raw[16:20]), _aton(src_ip), orig_if_idx
+                        )
 
-                    packet.src_addr = new_src_ip
+                    # In-place rewrite with incremental checksum fixup —
+                    # the src_addr setter plus pydivert's send-side
+                    # recalculation would walk the whole packet instead
+                    _rewrite_ip_inplace(packet.raw, 12, self._target_ip_packed)
 
                     # Redirect packet to the correct network interface
                     if target_if_index is not None:
                         packet.interface = (target_if_index, 0)
 
-                    send(packet)
+                    send(packet, False)
 
-                except Exception as e:
-                    if stop():
-                        break
-                    log.debug(f"Outbound packet error: {e}")
-        finally:
-            with self._handle_lock:
-                self._outbound_handle = None
-            try:
-                w.close()
-            except Exception:
-                pass
+            except Exception as e:
+                if stop():
+                    return
+                log.debug(f"Outbound packet error: {e}")
 
     # ------------------------------------------------------------------
     # Inbound Interceptor Thread
@@ -562,6 +873,7 @@ class SplitEngine:
 
     def _inbound_interceptor_loop(self):
         """Intercept inbound packets and reverse-NAT destination IP."""
+        _boost_thread_priority()
         try:
             w = pydivert.WinDivert(
                 "inbound and ip and (tcp or udp) "
@@ -586,48 +898,104 @@ class SplitEngine:
         except threading.BrokenBarrierError:
             pass
 
+        api = _bind_raw_api()
+        handle = getattr(w, "_handle", None)
+        try:
+            if api and handle is not None:
+                self._inbound_raw_loop(handle, api)
+            else:
+                self._inbound_packet_loop(w)
+        finally:
+            with self._handle_lock:
+                self._inbound_handle = None
+            try:
+                w.close()
+            except Exception:
+                pass
+
+    def _inbound_raw_loop(self, handle, api):
+        """Per-packet work against the raw buffer (see _outbound_raw_loop)."""
+        recv_fn, send_fn = api
+        buf = (ctypes.c_ubyte * 65535)()
+        raw_full = memoryview(buf)
+        addr = _WINDIVERT_ADDRESS()
+        addr_ref = ctypes.byref(addr)
+        recv_len = ctypes.c_uint(0)
+        recv_len_ref = ctypes.byref(recv_len)
+        stop = self._stop_event.is_set
+
+        # Straight-line per-packet path; stop is only checked when recv
+        # fails, which is how stop() unblocks us (it closes the handle)
+        while not stop():
+            try:
+                while True:
+                    if not recv_fn(handle, buf, 65535, addr_ref, recv_len_ref):
+                        if stop():
+                            return
+                        continue
+                    n = recv_len.value
+                    raw = raw_full[:n]
+
+                    # (remote_port << 16) | local_port, read straight
+                    # from the L4 header; most packets miss immediately
+                    ihl = (raw[0] & 0x0F) * 4
+                    nat_entry = self._nat_table.get(
+                        (((raw[ihl] << 8) | raw[ihl + 1]) << 16)
+                        | (raw[ihl + 2] << 8) | raw[ihl + 3]
+                    )
+                    if nat_entry and nat_entry[0] == raw[12:16]:
+                        _, orig_ip_packed, original_if_idx = nat_entry
+                        if raw[16:20] != orig_ip_packed:
+                            # In-place dst rewrite + incremental checksum
+                            # fixup, then deliver on the original interface
+                            # so the OS accepts it (strong host model)
+                            _rewrite_ip_inplace(raw, 16, orig_ip_packed)
+                            addr.IfIdx = original_if_idx
+                            addr.SubIfIdx = 0
+                    send_fn(handle, buf, n, addr_ref, None)
+            except Exception as e:
+                if stop():
+                    return
+                log.debug(f"Inbound packet error: {e}")
+
+    def _inbound_packet_loop(self, w):
+        """Fallback loop through pydivert Packet objects."""
         send = w.send
         recv = w.recv
         stop = self._stop_event.is_set
 
-        try:
-            while not stop():
-                try:
+        # Straight-line per-packet path; recv raising (handle closed by
+        # stop()) lands in the same branch as packet errors
+        while not stop():
+            try:
+                while True:
                     packet = recv()
-                except Exception:
-                    if stop():
-                        break
-                    continue
-                if packet is None:
-                    continue
 
-                try:
-                    # Lock-free read of NAT table (atomic dict.get via GIL)
+                    # Lock-free read of NAT table (atomic dict.get via
+                    # GIL); the packed int key avoids a tuple allocation
+                    # per packet, and most packets miss immediately
                     nat_entry = self._nat_table.get(
-                        (packet.src_addr, packet.src_port, packet.dst_port)
+                        (packet.src_port << 16) | packet.dst_port
                     )
 
-                    if nat_entry:
-                        original_ip, original_if_idx = nat_entry
-                        if packet.dst_addr != original_ip:
-                            packet.dst_addr = original_ip
-                            # Deliver on the original interface so the OS
-                            # accepts the packet (strong host model)
+                    raw = packet.raw
+                    if nat_entry and nat_entry[0] == raw[12:16]:
+                        _, orig_ip_packed, original_if_idx = nat_entry
+                        if raw[16:20] != orig_ip_packed:
+                            # In-place dst rewrite + incremental checksum
+                            # fixup, then deliver on the original
+                            # interface so the OS accepts the packet
+                            # (strong host model)
+                            _rewrite_ip_inplace(raw, 16, orig_ip_packed)
                             packet.interface = (original_if_idx, 0)
+                            send(packet, False)
+                            continue
 
                     send(packet)
-
-                except Exception as e:
-                    if stop():
-                        break
-                    log.debug(f"Inbound packet error: {e}")
-        finally:
-            with self._handle_lock:
-                self._inbound_handle = None
-            try:
-                w.close()
-            except Exception:
-                pass
+            except Exception as e:
+                if stop():
+                    return
+                log.debug(f"Inbound packet error: {e}")
 
     # ------------------------------------------------------------------
     # NAT table maintenance
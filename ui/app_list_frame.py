@@ -4,10 +4,26 @@ App list frame — tabbed view (Active / Apps / All Processes) with toggle switc
 
 import os
 import threading
+import tkinter as tk
 import customtkinter as ctk
 
-from ui.app_row import AppRow
-from core.process_scanner import scan_processes, scan_windowed_apps, extract_icon
+from ui.app_row import AppRow, _truncate_path
+from core.process_scanner import (
+    scan_processes, scan_windowed_apps, extract_icon, prefetch_icons_for,
+    extract_icons_batch,
+)
+
+# Virtualized "All Processes" geometry: fixed row height (AppRow is
+# height=50 plus 1 px padding top and bottom) and extra pooled rows kept
+# around the viewport so small scrolls never expose a gap.
+_ALL_ROW_H = 52
+_ALL_OVERSCAN = 4
+
+# Apps-tab rows created per event-loop slice while populating.  The
+# heavyweight list is virtualized, so batches can be generous: fewer
+# idle-task passes (each one is a full geometry recomputation) without
+# noticeable stalls.
+_APPS_BATCH_SIZE = 32
 
 
 class AppListFrame(ctk.CTkFrame):
@@ -19,6 +35,12 @@ class AppListFrame(ctk.CTkFrame):
         ┌─── Active ────┬─── Apps ──────┬─── All Processes ───┐
         │               │               │                      │
         └───────────────┴───────────────┴──────────────────────┘
+
+    The Active and Apps tabs hold at most a few dozen rows and keep one
+    AppRow widget per entry.  The All Processes tab is virtualized: a
+    plain canvas scrolls over the data model while a small pool of
+    recycled AppRow widgets is rebound to whatever slice is visible —
+    widget construction cost is O(viewport), not O(processes).
     """
 
     def __init__(self, master, mode="vpn_default", default_icon=None,
@@ -30,9 +52,14 @@ class AppListFrame(ctk.CTkFrame):
         self._on_toggle = on_toggle
         self._on_toggled_count_change = on_toggled_count_change
         self._active_rows = []         # AppRow widgets in "Active" tab
+        self._active_rows_by_path = {}  # exe_path -> AppRow (same rows)
         self._apps_rows = []           # AppRow widgets in "Apps" tab
-        self._all_rows = []            # AppRow widgets in "All Processes" tab
+        self._apps_rows_by_path = {}   # exe_path -> AppRow (same rows)
         self._toggled_apps = {}        # exe_path -> bool (shared state)
+        self._filter_after_id = None   # pending debounced _apply_filter
+        self._last_filter_text = ""    # filter string last applied
+        self._pending_toggles = []     # (exe_path, state) since last flush
+        self._flush_scheduled = False  # after_idle flush already queued
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -42,6 +69,12 @@ class AppListFrame(ctk.CTkFrame):
         top_bar.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
         top_bar.grid_columnconfigure(0, weight=1)
 
+        # One StringVar drives every row's switch label, so a mode
+        # change is a single variable set instead of N configure calls
+        self._switch_text_var = ctk.StringVar(
+            value="Exclude" if mode == "vpn_default" else "Include"
+        )
+
         self._search_var = ctk.StringVar()
         self._search_var.trace_add("write", self._on_search_changed)
         self._search_entry = ctk.CTkEntry(
@@ -70,7 +103,7 @@ class AppListFrame(ctk.CTkFrame):
         self._tab_apps = self._tabview.add("Apps")
         self._tab_all = self._tabview.add("All Processes")
 
-        # Scrollable frames inside each tab
+        # Scrollable frames inside the Active and Apps tabs
         self._tab_active.grid_columnconfigure(0, weight=1)
         self._tab_active.grid_rowconfigure(0, weight=1)
         self._active_scroll = ctk.CTkScrollableFrame(self._tab_active)
@@ -83,11 +116,31 @@ class AppListFrame(ctk.CTkFrame):
         self._apps_scroll.grid(row=0, column=0, sticky="nsew")
         self._apps_scroll.grid_columnconfigure(0, weight=1)
 
+        # Virtualized All Processes tab: canvas + scrollbar + row pool
         self._tab_all.grid_columnconfigure(0, weight=1)
         self._tab_all.grid_rowconfigure(0, weight=1)
-        self._all_scroll = ctk.CTkScrollableFrame(self._tab_all)
-        self._all_scroll.grid(row=0, column=0, sticky="nsew")
-        self._all_scroll.grid_columnconfigure(0, weight=1)
+        frame_color = self._tabview._apply_appearance_mode(
+            ctk.ThemeManager.theme["CTkFrame"]["fg_color"]
+        )
+        self._all_canvas = tk.Canvas(
+            self._tab_all, highlightthickness=0, bd=0,
+            bg=frame_color, yscrollincrement=_ALL_ROW_H,
+        )
+        self._all_canvas.grid(row=0, column=0, sticky="nsew")
+        self._all_scrollbar = ctk.CTkScrollbar(
+            self._tab_all, command=self._all_canvas.yview
+        )
+        self._all_scrollbar.grid(row=0, column=1, sticky="ns")
+        self._all_canvas.configure(yscrollcommand=self._on_all_yset)
+        self._all_canvas.bind(
+            "<Configure>", lambda e: self._render_all_viewport()
+        )
+        self._all_canvas.bind("<MouseWheel>", self._on_all_mousewheel)
+
+        self._all_data = []        # (proc, lowercase haystack), full list
+        self._all_view = []        # filtered subset currently scrollable
+        self._all_pool = []        # recycled AppRow widgets
+        self._all_pool_items = []  # matching canvas window item ids
 
         # Placeholder / loading labels
         self._active_empty = ctk.CTkLabel(
@@ -103,7 +156,7 @@ class AppListFrame(ctk.CTkFrame):
         self._apps_loading.grid(row=0, column=0, pady=20)
 
         self._all_loading = ctk.CTkLabel(
-            self._all_scroll, text="Click Refresh to scan running apps...",
+            self._tab_all, text="Click Refresh to scan running apps...",
             text_color="gray",
         )
         self._all_loading.grid(row=0, column=0, pady=20)
@@ -112,14 +165,19 @@ class AppListFrame(ctk.CTkFrame):
         self._mode = mode
         label = "No apps excluded yet." if mode == "vpn_default" else "No apps included yet."
         self._active_empty.configure(text=label)
-        for row in self._active_rows + self._apps_rows + self._all_rows:
+        self._switch_text_var.set(
+            "Exclude" if mode == "vpn_default" else "Include"
+        )
+        # Rows share _switch_text_var, so this just records the mode
+        for row in self._active_rows + self._apps_rows + self._all_pool:
             row.set_mode(mode)
 
     def set_toggled_apps(self, toggled_apps):
         """Restore toggled state from persisted config."""
         self._toggled_apps = {path: True for path in toggled_apps}
-        for row in self._apps_rows + self._all_rows:
+        for row in self._apps_rows:
             row.set_state(row.exe_path in self._toggled_apps)
+        self._render_all_viewport()
         self._rebuild_active_tab()
         self._notify_toggled_count()
 
@@ -138,13 +196,15 @@ class AppListFrame(ctk.CTkFrame):
         self._all_loading.configure(text="Scanning processes...")
         self._all_loading.grid(row=0, column=0, pady=20)
 
-        # Clear existing rows
+        # Clear existing rows / data model
         for row in self._apps_rows:
             row.destroy()
         self._apps_rows.clear()
-        for row in self._all_rows:
-            row.destroy()
-        self._all_rows.clear()
+        self._apps_rows_by_path.clear()
+        self._all_data = []
+        self._all_view = []
+        self._update_all_scrollregion()
+        self._render_all_viewport()
 
         # Scan in background thread
         thread = threading.Thread(target=self._scan_and_build, daemon=True)
@@ -154,73 +214,79 @@ class AppListFrame(ctk.CTkFrame):
         """Background thread: scan both process lists."""
         windowed = scan_windowed_apps()
         all_procs = scan_processes()
-        # Icon extraction must happen on main thread (Win32 GDI/COM requirement)
-        self.after(0, lambda: self._populate_both(windowed, all_procs))
+        # Warm the icon cache while still off the UI thread: the Apps
+        # tab rows are painted first, so extract those up front, then
+        # fan the long All Processes list out across the worker pool.
+        # Row creation on the main thread then only pays cache hits.
+        prefetch_icons_for(windowed)
+        done = {p.exe_path for p in windowed}
+        extract_icons_batch(
+            [p.exe_path for p in all_procs if p.exe_path not in done]
+        )
+        # Pre-truncate display paths here rather than per-row on the
+        # main thread during widget construction
+        display_paths = {
+            p.exe_path: _truncate_path(p.exe_path) for p in windowed
+        }
+        self.after(
+            0, lambda: self._populate_both(windowed, all_procs, display_paths)
+        )
 
-    def _populate_both(self, windowed, all_procs):
-        """Create AppRow widgets for both tabs in batches (runs on main thread)."""
+    def _populate_both(self, windowed, all_procs, display_paths=None):
+        """Populate the Apps rows (batched) and the All Processes data
+        model (runs on main thread)."""
         self._apps_loading.grid_forget()
         self._all_loading.grid_forget()
 
-        # Build flat list of (parent, proc_list, row_list) work items
-        all_work = []
-        for proc in windowed:
-            all_work.append(("apps", proc))
-        for proc in all_procs:
-            all_work.append(("all", proc))
-
         if not windowed:
             self._apps_loading.configure(text="No windowed applications found.")
             self._apps_loading.grid(row=0, column=0, pady=20)
 
+        # Virtualized tab: sort the data, not widgets — toggled first,
+        # then alphabetical, matching the widget tabs
+        toggled = self._toggled_apps
+        self._all_data = [
+            (p, f"{p.name}\n{p.exe_path}".lower()) for p in all_procs
+        ]
+        self._all_data.sort(
+            key=lambda e: (e[0].exe_path not in toggled, e[0].name_lc)
+        )
+
         self._batch_idx = 0
-        self._batch_work = all_work
-        self._batch_apps_idx = 0
-        self._batch_all_idx = 0
+        self._batch_work = windowed
+        self._batch_display_paths = display_paths or {}
         self._process_batch()
 
     def _process_batch(self):
-        """Create a batch of AppRow widgets, then yield to the event loop."""
-        BATCH_SIZE = 8
+        """Create a batch of Apps-tab rows, then yield to the event loop."""
         work = self._batch_work
-        end = min(self._batch_idx + BATCH_SIZE, len(work))
+        end = min(self._batch_idx + _APPS_BATCH_SIZE, len(work))
 
         for i in range(self._batch_idx, end):
-            tab, proc = work[i]
+            proc = work[i]
             icon = extract_icon(proc.exe_path)  # hits cache (pre-extracted)
-            initial_state = proc.exe_path in self._toggled_apps
-            if tab == "apps":
-                row = AppRow(
-                    self._apps_scroll,
-                    app_name=proc.name, exe_path=proc.exe_path,
-                    icon_image=icon, default_icon=self._default_icon,
-                    mode=self._mode, initial_state=initial_state,
-                    on_toggle=self._handle_toggle, pid_count=len(proc.pids),
-                )
-                row.grid(row=self._batch_apps_idx, column=0, sticky="ew", pady=1)
-                self._apps_rows.append(row)
-                self._batch_apps_idx += 1
-            else:
-                row = AppRow(
-                    self._all_scroll,
-                    app_name=proc.name, exe_path=proc.exe_path,
-                    icon_image=icon, default_icon=self._default_icon,
-                    mode=self._mode, initial_state=initial_state,
-                    on_toggle=self._handle_toggle, pid_count=len(proc.pids),
-                )
-                row.grid(row=self._batch_all_idx, column=0, sticky="ew", pady=1)
-                self._all_rows.append(row)
-                self._batch_all_idx += 1
+            row = AppRow(
+                self._apps_scroll,
+                app_name=proc.name, exe_path=proc.exe_path,
+                icon_image=icon, default_icon=self._default_icon,
+                mode=self._mode,
+                initial_state=proc.exe_path in self._toggled_apps,
+                on_toggle=self._handle_toggle, pid_count=len(proc.pids),
+                switch_text_var=self._switch_text_var,
+                display_path=self._batch_display_paths.get(proc.exe_path),
+            )
+            row.grid(row=i, column=0, sticky="ew", pady=1)
+            self._apps_rows.append(row)
+            self._apps_rows_by_path[proc.exe_path] = row
 
         self._batch_idx = end
 
-        if self._batch_idx < len(work):
+        if end < len(work):
             # Yield to event loop, then continue
             self.after(1, self._process_batch)
         else:
             # All done — finalize
             self._sort_rows_toggled_first(self._apps_rows, self._apps_scroll)
-            self._sort_rows_toggled_first(self._all_rows, self._all_scroll)
             self._refresh_btn.configure(state="normal", text="Refresh")
             self._toggle_all_btn.configure(state="normal")
             self._apply_filter()
@@ -228,6 +294,76 @@ class AppListFrame(ctk.CTkFrame):
             # Rebuild Active tab so it picks up freshly cached icons
             self._rebuild_active_tab()
 
+    # ------------------------------------------------------------------
+    # Virtualized All Processes tab
+    # ------------------------------------------------------------------
+
+    def _ensure_all_pool(self):
+        """Grow the recycled-row pool to cover the viewport + overscan."""
+        need = self._all_canvas.winfo_height() // _ALL_ROW_H + 2 + _ALL_OVERSCAN
+        while len(self._all_pool) < need:
+            row = AppRow(
+                self._all_canvas, app_name="", exe_path="",
+                default_icon=self._default_icon, mode=self._mode,
+                on_toggle=self._handle_toggle,
+                switch_text_var=self._switch_text_var,
+            )
+            row.bind("<MouseWheel>", self._on_all_mousewheel)
+            item = self._all_canvas.create_window(
+                0, 0, window=row, anchor="nw",
+                height=_ALL_ROW_H - 2, state="hidden",
+            )
+            self._all_pool.append(row)
+            self._all_pool_items.append(item)
+
+    def _render_all_viewport(self):
+        """Rebind the pooled rows to the data slice under the viewport."""
+        canvas = self._all_canvas
+        view = self._all_view
+        self._ensure_all_pool()
+
+        first = max(
+            0, int(canvas.canvasy(0)) // _ALL_ROW_H - _ALL_OVERSCAN // 2
+        )
+        width = max(canvas.winfo_width() - 4, 1)
+        toggled = self._toggled_apps
+        n = len(view)
+        for slot, (row, item) in enumerate(
+            zip(self._all_pool, self._all_pool_items)
+        ):
+            idx = first + slot
+            if idx < n:
+                proc = view[idx][0]
+                row.rebind(
+                    app_name=proc.name,
+                    exe_path=proc.exe_path,
+                    icon_image=extract_icon(proc.exe_path),
+                    pid_count=len(proc.pids),
+                    state=proc.exe_path in toggled,
+                )
+                canvas.coords(item, 2, idx * _ALL_ROW_H + 1)
+                canvas.itemconfigure(item, state="normal", width=width)
+            else:
+                canvas.itemconfigure(item, state="hidden")
+
+    def _update_all_scrollregion(self):
+        self._all_canvas.configure(
+            scrollregion=(0, 0, 0, max(len(self._all_view) * _ALL_ROW_H, 1))
+        )
+
+    def _on_all_yset(self, first, last):
+        """yscrollcommand hook: update the scrollbar, then re-render."""
+        self._all_scrollbar.set(first, last)
+        self._render_all_viewport()
+
+    def _on_all_mousewheel(self, event):
+        self._all_canvas.yview_scroll(-int(event.delta / 120), "units")
+        return "break"
+
+    # ------------------------------------------------------------------
+    # Toggle handling
+    # ------------------------------------------------------------------
+
     def _handle_toggle(self, exe_path, state):
         """Called when user toggles an app switch — sync across all tabs."""
         if state:
@@ -235,30 +371,63 @@ class AppListFrame(ctk.CTkFrame):
         else:
             self._toggled_apps.pop(exe_path, None)
 
-        # Sync toggle state across Apps and All Processes tabs
-        for row in self._apps_rows + self._all_rows:
-            if row.exe_path == exe_path:
-                if row.is_toggled != state:
-                    row.set_state(state)
+        # Sync toggle state across the Apps tab and visible pool rows
+        # (dict hit instead of a scan over every Apps row; the pool is
+        # viewport-sized, so scanning it stays O(1)-ish)
+        peer = self._apps_rows_by_path.get(exe_path)
+        if peer is not None and peer.is_toggled != state:
+            peer.set_state(state)
+        for row in self._all_pool:
+            if row.exe_path == exe_path and row.is_toggled != state:
+                row.set_state(state)
+
+        # Coalesce the expensive tail: Toggle All fires one
+        # _handle_toggle per row in a tight loop, and each used to pay
+        # an Active-tab rebuild plus a config save.  Queue the change
+        # and flush once when the event loop goes idle.
+        self._pending_toggles.append((exe_path, state))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_toggles)
+
+    def _flush_toggles(self):
+        """Run the per-burst tail of _handle_toggle exactly once."""
+        self._flush_scheduled = False
+        pending, self._pending_toggles = self._pending_toggles, []
+        if not pending:
+            return
 
         self._rebuild_active_tab()
         self._notify_toggled_count()
 
         if self._on_toggle:
+            # The handler re-reads the full toggled set itself, so one
+            # call with the last change is equivalent to one per change
+            exe_path, state = pending[-1]
             self._on_toggle(exe_path, state)
 
     def _toggle_all(self):
         """Toggle all visible apps in the current tab."""
         active_tab = self._tabview.get()
-        if active_tab == "Active":
-            rows = self._active_rows
-        elif active_tab == "Apps":
-            rows = self._apps_rows
-        else:
-            rows = self._all_rows
 
-        # Get visible rows
-        search_text = self._search_var.get().strip()
+        if active_tab == "All Processes":
+            # Virtualized tab: operate on the (filtered) data model
+            visible = [entry[0] for entry in self._all_view]
+            if not visible:
+                return
+            new_state = any(
+                p.exe_path not in self._toggled_apps for p in visible
+            )
+            for p in visible:
+                if (p.exe_path in self._toggled_apps) != new_state:
+                    self._handle_toggle(p.exe_path, new_state)
+            self._render_all_viewport()
+            return
+
+        rows = self._active_rows if active_tab == "Active" else self._apps_rows
+
+        # Get visible rows (filter text lowered once for all rows)
+        search_text = self._search_var.get().strip().lower()
         visible = [r for r in rows if not search_text or r.matches_filter(search_text)]
 
         if not visible:
@@ -274,10 +443,17 @@ class AppListFrame(ctk.CTkFrame):
                 self._handle_toggle(row.exe_path, new_state)
 
     def _on_search_changed(self, *args):
-        self._apply_filter()
+        # Debounce: refiltering regrids every row, so coalesce rapid
+        # keystrokes into one pass after the user pauses
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(80, self._apply_filter)
 
     def _apply_filter(self):
-        text = self._search_var.get().strip()
+        self._filter_after_id = None
+        # Lowercase once; every row compares against its precomputed
+        # lowercase haystack
+        text = self._search_var.get().strip().lower()
         for row in self._active_rows:
             if not text or row.matches_filter(text):
                 row.grid()
@@ -288,32 +464,40 @@ class AppListFrame(ctk.CTkFrame):
                 row.grid()
             else:
                 row.grid_remove()
-        for row in self._all_rows:
-            if not text or row.matches_filter(text):
-                row.grid()
-            else:
-                row.grid_remove()
-
-    def _rebuild_active_tab(self):
-        """Rebuild the Active tab from current _toggled_apps."""
-        for row in self._active_rows:
-            row.destroy()
-        self._active_rows.clear()
 
-        if not self._toggled_apps:
-            self._active_empty.grid(row=0, column=0, pady=20)
-            return
-
-        self._active_empty.grid_forget()
-
-        # Try to reuse app names/icons from existing rows in other tabs
-        known = {}
-        for row in self._apps_rows + self._all_rows:
-            known[row.exe_path] = row
+        # Virtualized tab: filter the data model and re-render — no
+        # per-row grid calls
+        if text:
+            self._all_view = [e for e in self._all_data if text in e[1]]
+        else:
+            self._all_view = list(self._all_data)
+        self._update_all_scrollregion()
+        # Jump to the top only when the search text itself changed;
+        # toggle- and rebuild-driven re-filters keep the scroll position
+        if text != self._last_filter_text:
+            self._last_filter_text = text
+            self._all_canvas.yview_moveto(0.0)
+        self._render_all_viewport()
 
-        sorted_paths = sorted(self._toggled_apps.keys(),
-                              key=lambda p: os.path.basename(p).lower())
-        for i, exe_path in enumerate(sorted_paths):
+    def _rebuild_active_tab(self):
+        """Update the Active tab to match _toggled_apps, reusing rows.
+
+        Toggles arrive one at a time, so instead of destroying and
+        recreating every row we diff against the existing widgets:
+        destroy rows whose app was untoggled, create rows for newly
+        toggled apps, and re-grid only when membership changed.
+        """
+        by_path = self._active_rows_by_path
+
+        stale = [p for p in by_path if p not in self._toggled_apps]
+        for path in stale:
+            by_path.pop(path).destroy()
+
+        added = False
+        known = self._apps_rows_by_path
+        for exe_path in self._toggled_apps:
+            if exe_path in by_path:
+                continue
             # Get name and icon from existing rows if available (no re-extraction)
             existing = known.get(exe_path)
             if existing:
@@ -332,25 +516,49 @@ class AppListFrame(ctk.CTkFrame):
                 mode=self._mode,
                 initial_state=True,
                 on_toggle=self._handle_toggle,
+                switch_text_var=self._switch_text_var,
             )
-            row.grid(row=i, column=0, sticky="ew", pady=1)
-            self._active_rows.append(row)
+            row.grid(row=len(by_path), column=0, sticky="ew", pady=1)
+            by_path[exe_path] = row
+            added = True
+
+        if not by_path:
+            self._active_rows = []
+            self._active_empty.grid(row=0, column=0, pady=20)
+            return
+
+        self._active_empty.grid_forget()
+
+        if not (stale or added):
+            return
+
+        # Membership changed: resort and renumber grid rows in place
+        ordered = sorted(by_path.values(), key=lambda r: r.app_name.lower())
+        for i, row in enumerate(ordered):
+            row.grid_configure(row=i)
+        self._active_rows = ordered
 
         self._apply_filter()
 
     def _sort_rows_toggled_first(self, rows, parent):
-        """Re-grid rows so toggled ones appear first, alphabetical within each group."""
+        """Reorder rows so toggled ones appear first, alphabetical within
+        each group.
+
+        The row list mirrors the grid order, so an already-sorted list
+        costs zero Tcl calls, and a resort renumbers only the rows whose
+        position actually changed (grid_configure, no forget+grid).
+        """
         toggled = [r for r in rows if r.exe_path in self._toggled_apps]
         untoggled = [r for r in rows if r.exe_path not in self._toggled_apps]
         toggled.sort(key=lambda r: r.app_name.lower())
         untoggled.sort(key=lambda r: r.app_name.lower())
         sorted_rows = toggled + untoggled
-        for r in rows:
-            r.grid_forget()
+        if sorted_rows == rows:
+            return
         for i, r in enumerate(sorted_rows):
-            r.grid(row=i, column=0, sticky="ew", pady=1)
-        rows.clear()
-        rows.extend(sorted_rows)
+            if rows[i] is not r:
+                r.grid_configure(row=i)
+        rows[:] = sorted_rows
 
     def _notify_toggled_count(self):
         """Notify the callback with the current toggled count."""
@@ -14,6 +14,13 @@ _MAX_PATH_CHARS = 60
 _HOVER_COLOR = "#2a2d2e"
 _NORMAL_COLOR = "transparent"
 
+# Widget-construction constants shared by every row instead of being
+# allocated per instance
+_NAME_FONT = ("", 14, "bold")
+_PATH_FONT = ("", 10)
+_PLACEHOLDER_FONT = ("", 20)
+_ICON_SIZE = (32, 32)
+
 
 def _truncate_path(path, max_len=_MAX_PATH_CHARS):
     if len(path) <= max_len:
@@ -21,6 +28,64 @@ def _truncate_path(path, max_len=_MAX_PATH_CHARS):
     return "..." + path[-(max_len - 3):]
 
 
+# Shared class-level event bindings.  Binding <Enter>/<Leave>/<Button-3>
+# on four widgets per row is 12 Tcl bind calls per AppRow; with a class
+# bindtag Tk stores the three handlers once and each row only prepends
+# the tag to its widgets' bindtags.
+_BINDTAG = "AppRowEvents"
+_class_bindings_installed = False
+
+
+def _find_app_row(widget):
+    """Walk from the event widget up to the owning AppRow, if any."""
+    while widget is not None and not isinstance(widget, AppRow):
+        widget = getattr(widget, "master", None)
+    return widget
+
+
+def _install_class_bindings(widget):
+    global _class_bindings_installed
+    if _class_bindings_installed:
+        return
+    _class_bindings_installed = True
+
+    def on_enter(event):
+        row = _find_app_row(event.widget)
+        if row is not None:
+            row._on_enter()
+
+    def on_leave(event):
+        row = _find_app_row(event.widget)
+        if row is not None:
+            row._on_leave()
+
+    def on_context(event):
+        row = _find_app_row(event.widget)
+        if row is not None:
+            row._show_context_menu(event)
+
+    widget.bind_class(_BINDTAG, "<Enter>", on_enter)
+    widget.bind_class(_BINDTAG, "<Leave>", on_leave)
+    widget.bind_class(_BINDTAG, "<Button-3>", on_context)
+
+
+# One shared CTkImage per PIL icon.  CTkImage wraps the image through
+# Tk PhotoImage, which allocates Tcl objects — re-wrapping the same
+# icon for every row and tab is wasted work.  Keyed by object identity:
+# the PIL icons live in process_scanner's cache (and the CTkImage here
+# keeps its own reference), so ids stay valid.
+_CTK_IMAGE_CACHE = {}
+
+
+def _ctk_image_for(pil_image):
+    img = _CTK_IMAGE_CACHE.get(id(pil_image))
+    if img is None:
+        img = _CTK_IMAGE_CACHE[id(pil_image)] = ctk.CTkImage(
+            light_image=pil_image, dark_image=pil_image, size=_ICON_SIZE
+        )
+    return img
+
+
 class AppRow(ctk.CTkFrame):
     """
     Single row in the app list showing:
@@ -30,22 +95,23 @@ class AppRow(ctk.CTkFrame):
     def __init__(self, master, app_name, exe_path, icon_image=None,
                  default_icon=None, mode="vpn_default",
                  initial_state=False, on_toggle=None, pid_count=1,
-                 **kwargs):
+                 switch_text_var=None, display_path=None, **kwargs):
         super().__init__(master, height=50, fg_color=_NORMAL_COLOR, **kwargs)
 
         self.exe_path = exe_path
         self._on_toggle = on_toggle
         self._mode = mode
         self._icon_image = icon_image  # keep reference for reuse
+        self._default_icon = default_icon
         self._app_name = app_name      # raw name without pid badge
 
         self.grid_columnconfigure(1, weight=1)
 
         # Icon
         if icon_image:
-            ctk_img = ctk.CTkImage(light_image=icon_image, dark_image=icon_image, size=(32, 32))
+            ctk_img = _ctk_image_for(icon_image)
         elif default_icon:
-            ctk_img = ctk.CTkImage(light_image=default_icon, dark_image=default_icon, size=(32, 32))
+            ctk_img = _ctk_image_for(default_icon)
         else:
             ctk_img = None
 
@@ -53,44 +119,88 @@ class AppRow(ctk.CTkFrame):
             self._icon_label = ctk.CTkLabel(self, image=ctk_img, text="")
             self._icon_label.grid(row=0, column=0, rowspan=2, padx=(10, 5), pady=5)
         else:
-            self._icon_label = ctk.CTkLabel(self, text="■", width=32, font=("", 20), text_color="gray")
+            self._icon_label = ctk.CTkLabel(self, text="■", width=32, font=_PLACEHOLDER_FONT, text_color="gray")
             self._icon_label.grid(row=0, column=0, rowspan=2, padx=(10, 5), pady=5)
 
         # App name with process count badge
         display_name = app_name
         if pid_count > 1:
             display_name = f"{app_name}  ({pid_count})"
+        # Lowercased haystack for matches_filter — computed once instead
+        # of lowering the label text and path on every filter pass
+        self._search_blob = f"{display_name}\n{exe_path}".lower()
         self._name_label = ctk.CTkLabel(
-            self, text=display_name, font=("", 14, "bold"), anchor="w"
+            self, text=display_name, font=_NAME_FONT, anchor="w"
         )
         self._name_label.grid(row=0, column=1, padx=5, pady=(5, 0), sticky="sw")
 
-        # Exe path (small, gray, truncated)
+        # Exe path (small, gray, truncated; callers building many rows
+        # pass display_path pre-truncated off the UI thread)
         self._path_label = ctk.CTkLabel(
-            self, text=_truncate_path(exe_path), font=("", 10), text_color="gray", anchor="w"
+            self, text=display_path or _truncate_path(exe_path),
+            font=_PATH_FONT, text_color="gray", anchor="w"
         )
         self._path_label.grid(row=1, column=1, padx=5, pady=(0, 5), sticky="nw")
 
-        # Toggle switch
-        switch_text = "Exclude" if mode == "vpn_default" else "Include"
+        # Toggle switch.  With a shared textvariable (owned by the list
+        # frame) a mode change updates every switch through one
+        # StringVar.set instead of one configure per row.
+        self._switch_text_var = switch_text_var
         self._switch_var = ctk.BooleanVar(value=initial_state)
-        self._switch = ctk.CTkSwitch(
-            self,
-            text=switch_text,
-            variable=self._switch_var,
-            command=self._handle_toggle,
-            width=50,
-        )
+        if switch_text_var is not None:
+            self._switch = ctk.CTkSwitch(
+                self,
+                textvariable=switch_text_var,
+                variable=self._switch_var,
+                command=self._handle_toggle,
+                width=50,
+            )
+        else:
+            self._switch = ctk.CTkSwitch(
+                self,
+                text="Exclude" if mode == "vpn_default" else "Include",
+                variable=self._switch_var,
+                command=self._handle_toggle,
+                width=50,
+            )
         self._switch.grid(row=0, column=2, rowspan=2, padx=10, pady=5)
 
-        # Hover effect + right-click
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<Button-3>", self._show_context_menu)
-        for child in (self._icon_label, self._name_label, self._path_label):
-            child.bind("<Enter>", self._on_enter)
-            child.bind("<Leave>", self._on_leave)
-            child.bind("<Button-3>", self._show_context_menu)
+        # Hover effect + right-click via the shared class bindtag.  CTk
+        # labels route events through their internal tk widgets, so the
+        # tag goes on those children as well.
+        _install_class_bindings(self)
+        widgets = [self]
+        for label in (self._icon_label, self._name_label, self._path_label):
+            widgets.append(label)
+            widgets.extend(label.winfo_children())
+        for w in widgets:
+            w.bindtags((_BINDTAG,) + w.bindtags())
+
+    def rebind(self, app_name, exe_path, icon_image=None, pid_count=1,
+               state=False):
+        """Point this row at a different process.
+
+        Virtualized lists keep a small pool of rows and rebind them to
+        whatever slice of the data is visible, instead of constructing
+        a widget tree per process.  Updates labels, icon and switch
+        in place; setting the BooleanVar does not fire the switch
+        command, so no toggle callbacks leak out of a rebind.
+        """
+        self.exe_path = exe_path
+        self._app_name = app_name
+
+        display_name = app_name
+        if pid_count > 1:
+            display_name = f"{app_name}  ({pid_count})"
+        self._search_blob = f"{display_name}\n{exe_path}".lower()
+        self._name_label.configure(text=display_name)
+        self._path_label.configure(text=_truncate_path(exe_path))
+
+        image = icon_image or self._default_icon
+        if image is not None:
+            self._icon_label.configure(image=_ctk_image_for(image), text="")
+        self._icon_image = icon_image
+        self._switch_var.set(state)
 
     @property
     def is_toggled(self):
@@ -102,19 +212,20 @@ class AppRow(ctk.CTkFrame):
 
     def set_mode(self, mode):
         self._mode = mode
-        switch_text = "Exclude" if mode == "vpn_default" else "Include"
-        self._switch.configure(text=switch_text)
+        if self._switch_text_var is None:
+            switch_text = "Exclude" if mode == "vpn_default" else "Include"
+            self._switch.configure(text=switch_text)
 
     def set_state(self, state):
         self._switch_var.set(state)
 
     def matches_filter(self, text):
-        """Check if this row matches a search filter string."""
-        text = text.lower()
-        return (
-            text in self._name_label.cget("text").lower()
-            or text in self.exe_path.lower()
-        )
+        """Check if this row matches a search filter string.
+
+        *text* must already be lowercased — callers filter many rows
+        with the same string, so it is lowered once on their side.
+        """
+        return text in self._search_blob
 
     def _on_enter(self, event=None):
         self.configure(fg_color=_HOVER_COLOR)
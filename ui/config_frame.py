@@ -23,6 +23,32 @@ class ConfigFrame(ctk.CTkFrame):
     status indicator, detected VPN info, mode selector, and toggled count.
     """
 
+    # Static per-state widget options, built once instead of assembling
+    # kwargs on every update_state call.  The button command is bound
+    # per instance, so update_state adds it separately.
+    _STATE_TEXT = {
+        "ACTIVE":   "Active",
+        "NO_VPN":   "No VPN detected",
+        "INACTIVE": "Inactive",
+    }
+    _BTN_STATE = {
+        "ACTIVE": {
+            "text": "Stop",
+            "fg_color": "#AA2222", "hover_color": "#881111",
+            "state": "normal",
+        },
+        "NO_VPN": {
+            "text": "Start",
+            "fg_color": "#7c3aad", "hover_color": "#5a2880",
+            "state": "normal",
+        },
+        "INACTIVE": {
+            "text": "Start",
+            "fg_color": "#7c3aad", "hover_color": "#5a2880",
+            "state": "normal",
+        },
+    }
+
     def __init__(self, master, on_start=None, on_stop=None,
                  on_mode_change=None, **kwargs):
         super().__init__(master, **kwargs)
@@ -31,6 +57,7 @@ class ConfigFrame(ctk.CTkFrame):
         self._on_stop = on_stop
         self._on_mode_change = on_mode_change
         self._active = False
+        self._last_state = None
 
         self.grid_columnconfigure(0, weight=1)
 
@@ -134,39 +161,26 @@ class ConfigFrame(ctk.CTkFrame):
 
     def update_state(self, state, message=""):
         """Update the status display. States: ACTIVE, INACTIVE, NO_VPN."""
-        color = _STATE_COLORS.get(state, "#FF4444")
-        self._status_dot.configure(text_color=color)
-
-        if state == "ACTIVE":
-            self._status_label.configure(text="Active")
-            self._active = True
-            self._start_btn.configure(
-                text="Stop",
-                fg_color="#AA2222", hover_color="#881111",
-                command=self._handle_stop,
-                state="normal",
-            )
-        elif state == "NO_VPN":
-            self._status_label.configure(text="No VPN detected")
-            self._active = False
-            self._start_btn.configure(
-                text="Start",
-                fg_color="#7c3aad", hover_color="#5a2880",
-                command=self._handle_start,
-                state="normal",
-            )
-        else:  # INACTIVE
-            self._status_label.configure(text="Inactive")
-            self._active = False
-            self._start_btn.configure(
-                text="Start",
-                fg_color="#7c3aad", hover_color="#5a2880",
-                command=self._handle_start,
-                state="normal",
-            )
+        if state not in self._BTN_STATE:
+            state = "INACTIVE"
+        if state == self._last_state:
+            # The VPN monitor reports the same state every poll; skip
+            # the five no-op configure round-trips
+            return
+        self._last_state = state
+
+        self._active = state == "ACTIVE"
+        self._status_dot.configure(text_color=_STATE_COLORS[state])
+        self._status_label.configure(text=self._STATE_TEXT[state])
+        self._start_btn.configure(
+            command=self._handle_stop if self._active else self._handle_start,
+            **self._BTN_STATE[state],
+        )
 
     def _handle_start(self):
-        # Disable button while detecting VPN
+        # Disable button while detecting VPN; the widgets no longer
+        # match _last_state, so force the next update_state to repaint
+        self._last_state = None
         self._start_btn.configure(state="disabled")
         self._status_label.configure(text="Detecting VPN...")
         self._status_dot.configure(text_color="#FFAA00")
@@ -3,9 +3,40 @@ Log panel — collapsible real-time log viewer with a custom logging handler.
 """
 
 import logging
+import queue
+import time
+
 import customtkinter as ctk
 
 MAX_LOG_LINES = 500
+# Trim this many lines past the cap before deleting: Tk walks the text
+# buffer from the top for every delete, so trimming in chunks amortizes
+# that traversal instead of paying it once the panel sits at the cap
+_TRIM_CHUNK = 50
+# How often the UI thread drains queued records into the textbox
+_DRAIN_INTERVAL_MS = 50
+# Batches larger than this get their scroll-to-end deferred to idle
+_DEFER_SCROLL_BYTES = 16 * 1024
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter whose timestamp is only second-granular (%H:%M:%S), so
+    the strftime result is cached until the second rolls over instead
+    of re-running C strftime for every record in a burst."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_t = None
+        self._last_asctime = ""
+
+    def formatTime(self, record, datefmt=None):
+        t = int(record.created)
+        if t != self._last_t:
+            self._last_asctime = time.strftime(
+                datefmt or "%H:%M:%S", time.localtime(t)
+            )
+            self._last_t = t
+        return self._last_asctime
 
 
 class _UILogHandler(logging.Handler):
@@ -18,7 +49,7 @@ class _UILogHandler(logging.Handler):
     def emit(self, record):
         try:
             msg = self.format(record)
-            self._panel.after(0, self._panel.append_line, msg)
+            self._panel.append_line(msg)
         except Exception:
             self.handleError(record)
 
@@ -33,6 +64,7 @@ class LogPanel(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self._visible = False
         self._line_count = 0
+        self._pending = queue.SimpleQueue()
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -51,6 +83,10 @@ class LogPanel(ctk.CTkFrame):
         # Start hidden
         self.grid_remove()
 
+        # Periodic drain on the Tk thread.  Emitters only touch the
+        # queue, so they never schedule into (or lock against) Tk.
+        self.after(_DRAIN_INTERVAL_MS, self._drain)
+
     def toggle(self):
         """Show or hide the log panel. Returns new visibility state."""
         if self._visible:
@@ -66,27 +102,59 @@ class LogPanel(ctk.CTkFrame):
         return self._visible
 
     def append_line(self, text):
-        """Append a log line to the textbox (must be called from main thread)."""
-        self._textbox.configure(state="normal")
+        """Queue a log line for the textbox.
+
+        Called from any thread.  This is a bare SimpleQueue.put — no Tk
+        call, so engine and network threads never serialize on the Tk
+        interpreter lock just to log.  The UI thread drains the queue
+        every _DRAIN_INTERVAL_MS and a whole burst of records costs one
+        state flip, one insert, one trim and one scroll.
+        """
+        self._pending.put_nowait(text)
+
+    def _drain(self):
+        """Drain queued lines into the textbox (runs on main thread)."""
+        self.after(_DRAIN_INTERVAL_MS, self._drain)
+        pending = self._pending
+        if pending.empty():
+            return
+
+        lines = []
+        try:
+            while True:
+                lines.append(pending.get_nowait())
+        except queue.Empty:
+            pass
+        chunk = "\n".join(lines)
+
+        textbox = self._textbox
+        textbox.configure(state="normal")
         if self._line_count > 0:
-            self._textbox.insert("end", "\n")
-        self._textbox.insert("end", text)
-        self._line_count += 1
+            textbox.insert("end", "\n")
+        textbox.insert("end", chunk)
+        self._line_count += len(lines)
 
-        # Trim old lines if over the cap
-        if self._line_count > MAX_LOG_LINES:
+        # Trim old lines once a full chunk has accumulated past the cap
+        # (the panel may briefly hold up to _TRIM_CHUNK extra lines)
+        if self._line_count >= MAX_LOG_LINES + _TRIM_CHUNK:
             excess = self._line_count - MAX_LOG_LINES
-            self._textbox.delete("1.0", f"{excess + 1}.0")
+            textbox.delete("1.0", f"{excess + 1}.0")
             self._line_count = MAX_LOG_LINES
 
-        self._textbox.configure(state="disabled")
-        self._textbox.see("end")
+        textbox.configure(state="disabled")
+        # After a very large insert, see("end") forces a synchronous
+        # layout pass over the new text; deferring it to the next idle
+        # lets Tk fold the scroll into its normal redraw
+        if len(chunk) > _DEFER_SCROLL_BYTES:
+            self.after_idle(textbox.see, "end")
+        else:
+            textbox.see("end")
 
     def create_handler(self):
         """Create and return a logging.Handler that feeds into this panel."""
         handler = _UILogHandler(self)
         handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-                              datefmt="%H:%M:%S")
+            _CachedTimeFormatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+                                 datefmt="%H:%M:%S")
         )
         return handler
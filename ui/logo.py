@@ -3,6 +3,8 @@ Logo rendering — generates the FREAKUENCY neon logo and app icon using Pillow.
 No external SVG dependencies needed; recreates the look from the SVG source.
 """
 
+import functools
+import hashlib
 import os
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
@@ -13,7 +15,38 @@ _GLOW_COLOR = (191, 90, 242)          # #bf5af2
 _TEXT_COLOR = (232, 192, 255, 255)     # #e8c0ff (bright core)
 _TAG_COLOR = (191, 90, 242, 100)       # #bf5af2 at ~40% opacity
 
+# Renders are deterministic in (kind, size, palette), and the Gaussian
+# blur passes are the expensive part, so finished art is cached as PNG
+# alongside the extracted-icon cache and simply reloaded on later runs.
+_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "icon_cache",
+)
 
+
+def _cache_path(kind, *params):
+    key = f"{kind}|{params}|{_GLOW_COLOR}|{_TEXT_COLOR}|{_TAG_COLOR}"
+    digest = hashlib.sha1(key.encode("utf-8", "replace")).hexdigest()
+    return os.path.join(_CACHE_DIR, f"logo_{digest}.png")
+
+
+def _load_cached(path):
+    try:
+        with Image.open(path) as cached:
+            return cached.convert("RGBA")
+    except Exception:
+        return None
+
+
+def _store_cached(path, img):
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        img.save(path, "PNG")
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=16)
 def _load_mono_bold(size):
     """Try to load a bold monospace font, fall back gracefully."""
     for name in ("consolab.ttf", "consola.ttf", "courbd.ttf", "cour.ttf"):
@@ -24,6 +57,7 @@ def _load_mono_bold(size):
     return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=16)
 def _load_mono(size):
     """Try to load a regular monospace font."""
     for name in ("consola.ttf", "cour.ttf"):
@@ -34,11 +68,20 @@ def _load_mono(size):
     return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=8)
 def render_logo_banner(width=500, height=110):
     """
     Render the FREAKUENCY neon logo banner as a PIL RGBA Image.
     Transparent background with purple glow text and tagline.
+
+    Memoized in-process and cached as PNG on disk — the blur passes
+    only ever run once per size.
     """
+    cache_path = _cache_path("banner", width, height)
+    cached = _load_cached(cache_path)
+    if cached is not None:
+        return cached
+
     img = Image.new("RGBA", (width, height), _TRANSPARENT)
 
     font = _load_mono_bold(int(height * 0.52))
@@ -47,62 +90,80 @@ def render_logo_banner(width=500, height=110):
     text_y = int(height * 0.38)
     tag_y = int(height * 0.78)
 
+    # Rasterize the text once as a grayscale coverage mask.  Every layer
+    # is the same glyphs at a different opacity and blur, so the blurs
+    # run on 1 byte/px instead of 4 and the text draw happens once
+    # instead of three times; a 256-entry point LUT rescales the blurred
+    # mask to each layer's opacity.
+    mask = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(mask).text((width // 2, text_y), "FREAKUENCY",
+                              font=font, fill=255, anchor="mm")
+
     # Layer 1: soft background glow
-    glow_bg = Image.new("RGBA", (width, height), _TRANSPARENT)
-    d = ImageDraw.Draw(glow_bg)
-    d.text((width // 2, text_y), "FREAKUENCY", font=font,
-           fill=(*_GLOW_COLOR, 70), anchor="mm")
-    glow_bg = glow_bg.filter(ImageFilter.GaussianBlur(14))
-    img = Image.alpha_composite(img, glow_bg)
+    glow_bg = Image.new("RGBA", (width, height), (*_GLOW_COLOR, 0))
+    glow_bg.putalpha(
+        mask.filter(ImageFilter.GaussianBlur(14)).point(lambda v: v * 70 // 255)
+    )
+    img.alpha_composite(glow_bg)
 
     # Layer 2: sharper neon glow
-    glow = Image.new("RGBA", (width, height), _TRANSPARENT)
-    d = ImageDraw.Draw(glow)
-    d.text((width // 2, text_y), "FREAKUENCY", font=font,
-           fill=(*_GLOW_COLOR, 180), anchor="mm")
-    glow = glow.filter(ImageFilter.GaussianBlur(4))
-    img = Image.alpha_composite(img, glow)
-
-    # Layer 3: bright core text
-    core = Image.new("RGBA", (width, height), _TRANSPARENT)
-    d = ImageDraw.Draw(core)
-    d.text((width // 2, text_y), "FREAKUENCY", font=font,
-           fill=_TEXT_COLOR, anchor="mm")
-    img = Image.alpha_composite(img, core)
+    glow = Image.new("RGBA", (width, height), (*_GLOW_COLOR, 0))
+    glow.putalpha(
+        mask.filter(ImageFilter.GaussianBlur(4)).point(lambda v: v * 180 // 255)
+    )
+    img.alpha_composite(glow)
+
+    # Layer 3: bright core text (unblurred mask at full opacity)
+    core = Image.new("RGBA", (width, height), (*_TEXT_COLOR[:3], 0))
+    core.putalpha(mask)
+    img.alpha_composite(core)
 
     # Tagline
     draw = ImageDraw.Draw(img)
     draw.text((width // 2, tag_y), "$ route --per-app", font=tag_font,
               fill=_TAG_COLOR, anchor="mm")
 
+    _store_cached(cache_path, img)
     return img
 
 
+@functools.lru_cache(maxsize=8)
 def render_app_icon(size=64):
     """
     Render a small app icon: bold 'F' with purple glow on transparent background.
     Suitable for the window title bar icon.
+
+    Memoized and disk-cached like render_logo_banner.
     """
+    cache_path = _cache_path("icon", size)
+    cached = _load_cached(cache_path)
+    if cached is not None:
+        return cached
+
     img = Image.new("RGBA", (size, size), _TRANSPARENT)
 
     font = _load_mono_bold(int(size * 1.0))
 
     cx, cy = size // 2, size // 2
 
+    # Single grayscale coverage mask, as in render_logo_banner
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).text((cx, cy), "F", font=font, fill=255, anchor="mm")
+
     # Glow
-    glow = Image.new("RGBA", (size, size), _TRANSPARENT)
-    d = ImageDraw.Draw(glow)
-    d.text((cx, cy), "F", font=font, fill=(*_GLOW_COLOR, 180), anchor="mm")
     blur_radius = max(2, size // 16)
-    glow = glow.filter(ImageFilter.GaussianBlur(blur_radius))
-    img = Image.alpha_composite(img, glow)
+    glow = Image.new("RGBA", (size, size), (*_GLOW_COLOR, 0))
+    glow.putalpha(
+        mask.filter(ImageFilter.GaussianBlur(blur_radius)).point(lambda v: v * 180 // 255)
+    )
+    img.alpha_composite(glow)
 
     # Bright text
-    core = Image.new("RGBA", (size, size), _TRANSPARENT)
-    d = ImageDraw.Draw(core)
-    d.text((cx, cy), "F", font=font, fill=_TEXT_COLOR, anchor="mm")
-    img = Image.alpha_composite(img, core)
+    core = Image.new("RGBA", (size, size), (*_TEXT_COLOR[:3], 0))
+    core.putalpha(mask)
+    img.alpha_composite(core)
 
+    _store_cached(cache_path, img)
     return img
 
 
@@ -116,3 +177,18 @@ def generate_ico(output_path):
     images[-1].save(output_path, format="ICO",
                     sizes=[(s, s) for s in sizes],
                     append_images=images[:-1])
+
+
+if __name__ == "__main__":
+    # Build-time entry point — regenerates the shipped window icon after
+    # a palette or font change:
+    #     python -m ui.logo [assets/freakuency.ico]
+    # The app itself never renders the .ico; it loads the checked-in
+    # file from assets/.
+    import sys
+
+    default_out = os.path.join(os.path.dirname(_CACHE_DIR),
+                               "assets", "freakuency.ico")
+    out = sys.argv[1] if len(sys.argv) > 1 else default_out
+    generate_ico(out)
+    print(f"Wrote {out}")
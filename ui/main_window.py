@@ -4,12 +4,15 @@ Main window — top-level layout assembling all UI frames.
 
 import os
 import sys
-import webbrowser
 import tkinter as tk
-from tkinter import messagebox, filedialog
 
 import customtkinter as ctk
 
+# webbrowser and the tkinter dialog modules (messagebox/filedialog) are
+# imported inside the menu actions that use them: they register Tcl
+# procs / walk their own import graphs at import time, and none of that
+# is needed before first paint.
+
 from ui.config_frame import ConfigFrame
 from ui.app_list_frame import AppListFrame
 from ui.log_panel import LogPanel
@@ -63,6 +66,11 @@ class MainWindow(ctk.CTk):
 
         # ── Custom menu bar (dark themed) ──
         self._active_menu = None
+        self._startup_enabled_cache = None
+        self._pending_count = None
+        self._count_update_scheduled = False
+        self._log_minsize = 0
+        self._about_dlg = None
         self._build_menu_bar()
 
         self.grid_columnconfigure(0, weight=1)
@@ -119,19 +127,33 @@ class MainWindow(ctk.CTk):
         self._startup_var = tk.BooleanVar(value=self._is_startup_enabled())
         self._always_on_top_var = tk.BooleanVar(value=False)
 
-        self._file_btn = ctk.CTkButton(self._menu_bar, text="File", width=50, **btn_cfg,
-                                       command=lambda: self._show_dropdown(self._file_btn, self._file_items()))
-        self._file_btn.grid(row=0, column=0, padx=(4, 0), pady=1)
-
-        self._view_btn = ctk.CTkButton(self._menu_bar, text="View", width=50, **btn_cfg,
-                                       command=lambda: self._show_dropdown(self._view_btn, self._view_items()))
-        self._view_btn.grid(row=0, column=1, pady=1)
-
-        self._help_btn = ctk.CTkButton(self._menu_bar, text="Help", width=50, **btn_cfg,
-                                       command=lambda: self._show_dropdown(self._help_btn, self._help_items()))
-        self._help_btn.grid(row=0, column=2, pady=1)
-
-    def _file_items(self):
+        # Menu contents are static (the checkable entries share their
+        # BooleanVars by reference), so the item lists are built once
+        # instead of on every open
+        self._file_items = self._build_file_items()
+        self._view_items = self._build_view_items()
+        self._help_items = self._build_help_items()
+
+        # One construction loop for the three identical menu buttons —
+        # any future restyle or widget swap happens in one place
+        self._menu_btns = []
+        specs = [
+            ("File", self._file_items),
+            ("View", self._view_items),
+            ("Help", self._help_items),
+        ]
+        for i, (label, items) in enumerate(specs):
+            btn = ctk.CTkButton(self._menu_bar, text=label, width=50, **btn_cfg)
+            btn.configure(command=lambda b=btn, m=items: self._show_dropdown(b, m))
+            btn.grid(row=0, column=i, padx=(4, 0) if i == 0 else 0, pady=1)
+            self._menu_btns.append(btn)
+        self._file_btn, self._view_btn, self._help_btn = self._menu_btns
+
+        # One pooled dropdown window, reused by all three menus — a
+        # fresh Toplevel per click means a native window create/destroy
+        self._popup = PopupMenu(self, persistent=True)
+
+    def _build_file_items(self):
         return [
             {"label": "Launch on Startup", "command": self._toggle_startup, "checkvar": self._startup_var},
             None,
@@ -143,7 +165,7 @@ class MainWindow(ctk.CTk):
             {"label": "Exit", "command": self._menu_exit},
         ]
 
-    def _view_items(self):
+    def _build_view_items(self):
         return [
             {"label": "Always on Top", "command": self._toggle_always_on_top, "checkvar": self._always_on_top_var},
             {"label": "Toggle Log Panel", "command": self._toggle_log},
@@ -151,7 +173,7 @@ class MainWindow(ctk.CTk):
             {"label": "Refresh App List", "command": self._menu_refresh},
         ]
 
-    def _help_items(self):
+    def _build_help_items(self):
         return [
             {"label": "GitHub Repository", "command": self._open_github},
             {"label": "Star on GitHub", "command": self._open_github},
@@ -160,11 +182,11 @@ class MainWindow(ctk.CTk):
         ]
 
     def _show_dropdown(self, btn, items):
-        """Create and show a PopupMenu below the given button."""
+        """Show the pooled PopupMenu below the given button."""
         x = btn.winfo_rootx()
         y = btn.winfo_rooty() + btn.winfo_height() + 2
-        menu = PopupMenu(self, items)
-        menu.show(x, y)
+        self._popup.update_items(items)
+        self._popup.show(x, y)
 
     # ------------------------------------------------------------------
     # File menu actions
@@ -192,11 +214,22 @@ class MainWindow(ctk.CTk):
                 except FileNotFoundError:
                     pass
             winreg.CloseKey(key)
+            self._startup_enabled_cache = self._startup_var.get()
         except Exception as e:
+            # Unknown registry state — force a re-query next time
+            self._startup_enabled_cache = None
+            from tkinter import messagebox
             messagebox.showerror("Startup Error", f"Could not update startup setting:\n{e}")
 
     def _is_startup_enabled(self):
-        """Check if Freakuency is in the Windows startup registry."""
+        """Check if Freakuency is in the Windows startup registry.
+
+        Cached after the first query; _toggle_startup keeps the cache in
+        sync when it rewrites the registry value, so repeat calls are an
+        attribute read instead of a registry round-trip.
+        """
+        if self._startup_enabled_cache is not None:
+            return self._startup_enabled_cache
         try:
             import winreg
             key = winreg.OpenKey(
@@ -205,15 +238,17 @@ class MainWindow(ctk.CTk):
             )
             try:
                 winreg.QueryValueEx(key, _APP_NAME)
-                winreg.CloseKey(key)
-                return True
+                enabled = True
             except FileNotFoundError:
-                winreg.CloseKey(key)
-                return False
+                enabled = False
+            winreg.CloseKey(key)
         except Exception:
-            return False
+            enabled = False
+        self._startup_enabled_cache = enabled
+        return enabled
 
     def _export_config(self):
+        from tkinter import filedialog
         path = filedialog.asksaveasfilename(
             title="Export Config",
             defaultextension=".json",
@@ -226,6 +261,7 @@ class MainWindow(ctk.CTk):
             self._on_export_config(path)
 
     def _import_config(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="Import Config",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -236,6 +272,7 @@ class MainWindow(ctk.CTk):
             self._on_import_config(path)
 
     def _export_logs(self):
+        from tkinter import filedialog
         path = filedialog.asksaveasfilename(
             title="Export Logs",
             defaultextension=".log",
@@ -270,22 +307,43 @@ class MainWindow(ctk.CTk):
     # ------------------------------------------------------------------
 
     def _open_github(self):
+        import webbrowser
         webbrowser.open(_GITHUB_URL)
 
     def _show_about(self):
-        """Show a custom-styled About dialog."""
-        dlg = ctk.CTkToplevel(self)
-        dlg.title(f"About {_APP_NAME}")
-        dlg.geometry("400x320")
-        dlg.resizable(False, False)
-        dlg.attributes("-topmost", True)
-        dlg.grab_set()
+        """Show the About dialog (built once, reshown afterwards)."""
+        if self._about_dlg is None or not self._about_dlg.winfo_exists():
+            self._about_dlg = self._build_about_dialog()
+        dlg = self._about_dlg
 
         # Center on parent
-        dlg.update_idletasks()
         px = self.winfo_rootx() + (self.winfo_width() - 400) // 2
         py = self.winfo_rooty() + (self.winfo_height() - 320) // 2
         dlg.geometry(f"+{px}+{py}")
+        dlg.deiconify()
+        dlg.lift()
+        dlg.grab_set()
+
+    def _hide_about(self):
+        dlg = self._about_dlg
+        if dlg is not None and dlg.winfo_exists():
+            dlg.grab_release()
+            dlg.withdraw()
+
+    def _build_about_dialog(self):
+        """Build the custom-styled About dialog, initially withdrawn.
+
+        The contents are static, so the widget tree is constructed once
+        and the dialog is withdrawn/reshown instead of being rebuilt
+        (and its Toplevel reallocated) on every Help > About.
+        """
+        dlg = ctk.CTkToplevel(self)
+        dlg.withdraw()
+        dlg.title(f"About {_APP_NAME}")
+        dlg.geometry("400x320")
+        dlg.resizable(False, False)
+        dlg.attributes("-topmost", True)
+        dlg.protocol("WM_DELETE_WINDOW", self._hide_about)
 
         # Icon path for dialog
         ico_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "freakuency.ico")
@@ -323,16 +381,18 @@ class MainWindow(ctk.CTk):
 
         ctk.CTkButton(
             btn_row, text="GitHub", width=100,
-            command=lambda: webbrowser.open(_GITHUB_URL),
+            command=self._open_github,
             fg_color="#bf5af2", hover_color="#9b3dd6",
         ).pack(side="left", padx=5)
 
         ctk.CTkButton(
             btn_row, text="Close", width=100,
-            command=dlg.destroy,
+            command=self._hide_about,
             fg_color="#555555", hover_color="#666666",
         ).pack(side="left", padx=5)
 
+        return dlg
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -340,12 +400,26 @@ class MainWindow(ctk.CTk):
     def _toggle_log(self):
         """Toggle the log panel visibility. Returns new state."""
         visible = self.log_panel.toggle()
-        if visible:
-            self.grid_rowconfigure(3, weight=0, minsize=180)
-        else:
-            self.grid_rowconfigure(3, weight=0, minsize=0)
+        # Each grid_rowconfigure triggers a full grid re-measure, so
+        # only touch the row when the minsize actually changes
+        target = 180 if visible else 0
+        if target != self._log_minsize:
+            self._log_minsize = target
+            self.grid_rowconfigure(3, weight=0, minsize=target)
         return visible
 
     def _on_toggled_count_change(self, count):
-        """Forward toggled count from app list to config frame."""
-        self.config_frame.update_toggled_count(count)
+        """Forward toggled count from app list to config frame.
+
+        Coalesced through after_idle: a bulk toggle (config import,
+        Toggle All) fires this once per app, but only the final count
+        is worth painting.
+        """
+        self._pending_count = count
+        if not self._count_update_scheduled:
+            self._count_update_scheduled = True
+            self.after_idle(self._flush_toggled_count)
+
+    def _flush_toggled_count(self):
+        self._count_update_scheduled = False
+        self.config_frame.update_toggled_count(self._pending_count)
@@ -4,67 +4,112 @@ menu bar dropdowns and right-click context menus.
 """
 
 import tkinter as tk
+from functools import partial
+
 import customtkinter as ctk
 
 
-class PopupMenu(tk.Toplevel):
+class PopupMenu(ctk.CTkToplevel):
     """
     A styled popup menu using a borderless Toplevel with CTk widgets.
     Shows with show(x, y) and auto-closes on outside click or Escape.
     """
 
-    def __init__(self, parent, items, width=200):
+    # Item-widget styling, shared across every menu build instead of
+    # re-spelling the kwargs (and re-allocating the dicts) per item
+    _BTN_STYLE = {
+        "height": 32, "corner_radius": 6,
+        "fg_color": "transparent", "hover_color": "#bf5af2",
+        "text_color": "#e0e0e0", "font": ("", 13),
+        "anchor": "w",
+    }
+    _CB_STYLE = {
+        "height": 32, "font": ("", 13),
+        "fg_color": "#bf5af2", "hover_color": "#9b3dd6",
+        "text_color": "#e0e0e0",
+        "checkbox_width": 18, "checkbox_height": 18,
+    }
+
+    def __init__(self, parent, items=None, width=200, persistent=False):
         """
         items: list of dicts or None (separator).
             {"label": str, "command": callable}
             {"label": str, "command": callable, "checkvar": tk.BooleanVar}
             None  -> separator line
+
+        With persistent=True the menu survives dismiss (it only
+        withdraws) so one instance can be pooled and reshown — Toplevel
+        creation is a native window allocation, which is noticeable
+        latency to pay on every menu click.
         """
-        super().__init__(parent)
+        super().__init__(parent, fg_color="#333333")
         self.withdraw()
         self.overrideredirect(True)
-        self.configure(bg="#333333")
         self.attributes("-topmost", True)
         self._parent = parent
-        self._click_id = None
         self._dismissed = False
+        self._bbox = None
+        self._defer_destroy = False
+        self._persistent = persistent
+        self._width = width
+        self._items = None           # requested entries
+        self._rendered_items = None  # entries the widgets currently show
 
-        frame = ctk.CTkFrame(
+        self._frame = ctk.CTkFrame(
             self, fg_color="#2b2b2b", corner_radius=8,
             border_width=1, border_color="#555555",
         )
-        frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self._frame.pack(fill="both", expand=True, padx=0, pady=0)
+
+        if items:
+            self.update_items(items)
+
+    def update_items(self, items):
+        """Replace the menu entries.
 
-        for item in items:
+        Only records the list — the item widgets are built lazily on
+        show(), so a menu that is constructed but never opened pays for
+        nothing, and pooled callers passing the same prebuilt lists
+        skip the rebuild entirely.
+        """
+        self._items = items
+
+    def _build_items(self):
+        frame = self._frame
+        for child in frame.winfo_children():
+            child.destroy()
+
+        for item in self._items:
             if item is None:
-                sep = ctk.CTkFrame(frame, height=1, fg_color="#444444")
+                # Plain tk.Frame — a 1 px divider doesn't need a CTk
+                # composite (canvas + frame) behind it
+                sep = tk.Frame(frame, height=1, bg="#444444",
+                               bd=0, highlightthickness=0)
                 sep.pack(fill="x", padx=10, pady=4)
             elif "checkvar" in item:
                 cb = ctk.CTkCheckBox(
                     frame, text=item["label"],
                     variable=item["checkvar"],
-                    command=lambda cmd=item["command"]: self._run(cmd),
-                    font=("", 13), height=32,
-                    fg_color="#bf5af2", hover_color="#9b3dd6",
-                    text_color="#e0e0e0",
-                    checkbox_width=18, checkbox_height=18,
+                    command=partial(self._run, item["command"]),
+                    **self._CB_STYLE,
                 )
                 cb.pack(anchor="w", fill="x", padx=10, pady=2)
             else:
                 btn = ctk.CTkButton(
                     frame, text="  " + item["label"],
-                    command=lambda cmd=item["command"]: self._run(cmd),
-                    height=32, corner_radius=6, width=width,
-                    fg_color="transparent", hover_color="#bf5af2",
-                    text_color="#e0e0e0", font=("", 13),
-                    anchor="w",
+                    command=partial(self._run, item["command"]),
+                    width=self._width,
+                    **self._BTN_STYLE,
                 )
                 btn.pack(fill="x", padx=6, pady=2)
 
-        frame.configure(corner_radius=8)
-
     def show(self, x, y):
         """Show the popup at screen coordinates (x, y)."""
+        if self._items != self._rendered_items:
+            self._build_items()
+            self._rendered_items = self._items
+        self._dismissed = False
+        self._bbox = None
         self.geometry(f"+{x}+{y}")
         self.deiconify()
         self.lift()
@@ -76,7 +121,15 @@ class PopupMenu(tk.Toplevel):
         """Bind events to auto-close the popup."""
         if self._dismissed:
             return
-        self._click_id = self._parent.bind_all("<Button-1>", self._on_global_click, add="+")
+        # A pointer grab routes every click to this window, so one
+        # local <Button-1> binding covers outside clicks — no bind_all
+        # walk over the whole app's bindtags, and no unbind_all on
+        # dismiss wiping unrelated handlers for the same sequence
+        try:
+            self.grab_set()
+        except tk.TclError:
+            pass
+        self.bind("<Button-1>", self._on_click)
         self.bind("<Escape>", lambda e: self.dismiss())
         self.bind("<FocusOut>", lambda e: self.after(100, self._check_focus))
 
@@ -86,18 +139,24 @@ class PopupMenu(tk.Toplevel):
             return
         try:
             focused = self.focus_get()
-            if focused is None or not str(focused).startswith(str(self)):
+            # Identity test on the owning toplevel instead of comparing
+            # Tk path-name strings
+            if focused is None or focused.winfo_toplevel() is not self:
                 self.dismiss()
         except Exception:
             self.dismiss()
 
-    def _on_global_click(self, event):
+    def _on_click(self, event):
         """Close popup if click is outside it."""
         if self._dismissed:
             return
         try:
-            mx, my = self.winfo_rootx(), self.winfo_rooty()
-            mw, mh = self.winfo_width(), self.winfo_height()
+            # Geometry is fixed once shown, so the four winfo round
+            # trips run once per open rather than per click
+            if self._bbox is None:
+                self._bbox = (self.winfo_rootx(), self.winfo_rooty(),
+                              self.winfo_width(), self.winfo_height())
+            mx, my, mw, mh = self._bbox
             if not (mx <= event.x_root <= mx + mw and my <= event.y_root <= my + mh):
                 self.dismiss()
         except Exception:
@@ -105,25 +164,37 @@ class PopupMenu(tk.Toplevel):
 
     def _run(self, command):
         """Execute a menu item command and close."""
+        # Destruction must outlive CTkButton's 100 ms click animation,
+        # which fires an after-callback against the pressed item
+        self._defer_destroy = True
         self.dismiss()
         command()
 
     def dismiss(self):
-        """Hide the popup, unbind global handlers, and schedule destruction."""
+        """Hide the popup and unbind global handlers.
+
+        One-shot menus are destroyed shortly after; persistent ones
+        stay withdrawn and wait for the next show().
+        """
         if self._dismissed:
             return
         self._dismissed = True
-        if self._click_id:
-            try:
-                self._parent.unbind_all("<Button-1>")
-            except Exception:
-                pass
-            self._click_id = None
+        try:
+            self.grab_release()
+        except Exception:
+            pass
         try:
             self.withdraw()
         except Exception:
             pass
+        if self._persistent:
+            return
         try:
-            self.after(200, self.destroy)
+            if self._defer_destroy:
+                self.after(200, self.destroy)
+            else:
+                # Escape / outside click / focus loss: no item callback
+                # is in flight, so the widget tree can go right away
+                self.destroy()
         except Exception:
             pass
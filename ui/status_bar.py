@@ -2,8 +2,14 @@
 Status bar — shows Freakuency stats at the bottom of the window.
 """
 
+import time
+
 import customtkinter as ctk
 
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+# Stats label refreshes are coalesced into at most one per this window
+_STATS_FLUSH_MS = 50
+
 
 class StatusBar(ctk.CTkFrame):
     """Bottom bar showing split tunnel statistics and log toggle."""
@@ -51,6 +57,19 @@ class StatusBar(ctk.CTkFrame):
         self._connected = False
         self._update_job = None
         self._log_visible = False
+        self._reset_scheduled = False
+        self._stats_pending = None
+        self._stats_scheduled = False
+
+        # While minimized the flush paths skip all label work (the
+        # timer keeps elapsed time; stats keep only the latest pair);
+        # remapping repaints from the stash
+        self.bind("<Map>", self._on_map)
+        # Last strings written to each stats label — configure round-trips
+        # to Tcl even for identical text, so unchanged values are skipped
+        self._last_down = None
+        self._last_up = None
+        self._last_duration = None
 
     def set_vpn_adapter(self, adapter_name, vpn_ip):
         """Display detected VPN adapter name and IP."""
@@ -61,18 +80,64 @@ class StatusBar(ctk.CTkFrame):
         self._start_timer()
 
     def update_stats(self, bytes_in, bytes_out):
-        self._download_label.configure(text=f"\u2193 {self._format_bytes(bytes_in)}")
-        self._upload_label.configure(text=f"\u2191 {self._format_bytes(bytes_out)}")
+        """Queue a stats refresh.
+
+        Throttled through a 50 ms window: however fast the producer
+        pushes, only the latest pair reaches the labels, bounding Tk
+        traffic to ~20 updates a second.
+        """
+        self._stats_pending = (bytes_in, bytes_out)
+        if not self._stats_scheduled:
+            self._stats_scheduled = True
+            self.after(_STATS_FLUSH_MS, self._flush_stats)
+
+    def _flush_stats(self):
+        self._stats_scheduled = False
+        if not self.winfo_viewable():
+            # Minimized or hidden — nothing to paint; the stash is
+            # flushed by the <Map> binding when the bar reappears
+            return
+        bytes_in, bytes_out = self._stats_pending
+        down = f"\u2193 {self._format_bytes(bytes_in)}"
+        if down != self._last_down:
+            self._last_down = down
+            self._download_label.configure(text=down)
+        up = f"\u2191 {self._format_bytes(bytes_out)}"
+        if up != self._last_up:
+            self._last_up = up
+            self._upload_label.configure(text=up)
 
     def reset(self):
-        self._adapter_label.configure(text="VPN: \u2014")
-        self._duration_label.configure(text="Duration: \u2014")
-        self._download_label.configure(text="\u2193 0 B")
-        self._upload_label.configure(text="\u2191 0 B")
+        """Stop the timer and clear the labels back to their idle text.
+
+        The label writes are deferred to one idle callback so a stop
+        event costs a single batched repaint, and repeated resets (or a
+        reset immediately followed by a reconnect) collapse into none.
+        """
         self._connected = False
         if self._update_job:
             self.after_cancel(self._update_job)
             self._update_job = None
+        if not self._reset_scheduled:
+            self._reset_scheduled = True
+            self.after_idle(self._flush_reset)
+
+    def _flush_reset(self):
+        self._reset_scheduled = False
+        if self._connected:
+            # Reconnected before the flush ran; the connect path has
+            # already written fresh label text
+            return
+        self._adapter_label.configure(text="VPN: \u2014")
+        self._duration_label.configure(text="Duration: \u2014")
+        self._download_label.configure(text="\u2193 0 B")
+        self._upload_label.configure(text="\u2191 0 B")
+        self._last_down = self._last_up = self._last_duration = None
+
+    def _on_map(self, event=None):
+        if self._stats_pending is not None and not self._stats_scheduled:
+            self._stats_scheduled = True
+            self.after(_STATS_FLUSH_MS, self._flush_stats)
 
     def _handle_log_toggle(self):
         if self._on_log_toggle:
@@ -81,26 +146,32 @@ class StatusBar(ctk.CTkFrame):
             self._log_btn.configure(text="Log \u25b2" if visible else "Log \u25bc")
 
     def _start_timer(self):
-        import time
         self._connect_time = time.monotonic()
         self._tick()
 
     def _tick(self):
         if not self._connected:
             return
-        import time
-        elapsed = int(time.monotonic() - self._connect_time)
-        hours, remainder = divmod(elapsed, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        self._duration_label.configure(
-            text=f"Duration: {hours:02d}:{minutes:02d}:{seconds:02d}"
-        )
-        self._update_job = self.after(1000, self._tick)
+        now = time.monotonic()
+        elapsed = int(now - self._connect_time)
+        if self.winfo_viewable():
+            hours, remainder = divmod(elapsed, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            duration = f"Duration: {hours:02d}:{minutes:02d}:{seconds:02d}"
+            if duration != self._last_duration:
+                self._last_duration = duration
+                self._duration_label.configure(text=duration)
+        # Re-arm aligned to the next whole second of connection time —
+        # a fixed 1000 ms re-arm accumulates callback latency as drift
+        # and eventually skips displayed seconds
+        delay = max(1, 1000 - int((now - self._connect_time) * 1000) % 1000)
+        self._update_job = self.after(delay, self._tick)
 
     @staticmethod
     def _format_bytes(n):
-        for unit in ("B", "KB", "MB", "GB"):
-            if n < 1024:
-                return f"{n:.1f} {unit}" if unit != "B" else f"{n} {unit}"
-            n /= 1024
-        return f"{n:.1f} TB"
+        # Byte counters are ints, so bit_length picks the unit directly
+        # (each unit step is 10 bits) — no divide-and-loop
+        if n < 1024:
+            return f"{n} B"
+        shift = min((n.bit_length() - 1) // 10, 4)
+        return f"{n / (1 << (shift * 10)):.1f} {_UNITS[shift]}"